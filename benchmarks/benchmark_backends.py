@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+"""Measure the throughput of saving each canvas type to a single output format."""
+import os
+import shutil
+import tempfile
+import timeit
+import numpy as np
+import mATLASplotlib
+
+N_REPEATS = 3
+N_PLOTS = 10
+
+
+def draw(canvas):
+    """Draw a typical histogram comparison on the main subplot of a canvas."""
+    bin_centres = np.linspace(-4.0, 4.0, 41)[:-1] + 0.1
+    expected = 1000 * np.exp(-0.5 * bin_centres**2)
+    observed = np.random.poisson(expected)
+    canvas.plot_dataset(bin_centres, np.full(40, 0.1), expected, None, style="bar", label="Prediction", colour="#ffff00", edgecolour="black")
+    canvas.plot_dataset(bin_centres, np.full(40, 0.1), observed, np.sqrt(observed), style="scatter yerror", label="Data", colour="black")
+    canvas.add_legend(0.04, 0.92, fontsize=16, anchor_to="upper left")
+    canvas.add_ATLAS_label(0.96, 0.92, plot_type="Internal", anchor_to="upper right")
+    canvas.set_axis_label("x", "$p_x$ [GeV]")
+    canvas.set_axis_label("y", "Events / 0.2 GeV")
+
+
+def save_plots(canvas_type, output_name, extension):
+    """Draw and save several plots on one type of canvas."""
+    for _ in range(N_PLOTS):
+        with getattr(mATLASplotlib.canvases, canvas_type)(shape="landscape") as canvas:
+            draw(canvas)
+            canvas.save(output_name, extension)
+
+
+if __name__ == "__main__":
+    output_directory = tempfile.mkdtemp()
+    output_name = os.path.join(output_directory, "benchmark")
+    mATLASplotlib.style.set_atlas()
+    for canvas_type in ["Simple", "Ratio", "Panelled"]:
+        for extension in ["png", "pdf"]:
+            duration = min(timeit.repeat(lambda: save_plots(canvas_type, output_name, extension), number=1, repeat=N_REPEATS))
+            print("{0:<10} {1:<4} {2:.1f} plots/s".format(canvas_type, extension, N_PLOTS / duration))
+    shutil.rmtree(output_directory)
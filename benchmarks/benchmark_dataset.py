@@ -0,0 +1,22 @@
+#! /usr/bin/env python
+"""Check that constructing the bin edges of a Dataset scales linearly with the number of bins."""
+import timeit
+import numpy as np
+from mATLASplotlib.converters import Dataset
+
+N_REPEATS = 5
+EDGE_ATTRIBUTES = ["x_all_bin_edges", "y_at_x_bin_edges", "x_at_y_bin_edges", "band_edges_x", "band_edges_y_low", "band_edges_y_high"]
+
+
+def build_edges(dataset):
+    """Construct every edge attribute of a dataset from scratch."""
+    dataset.invalidate_cache()
+    for name in EDGE_ATTRIBUTES:
+        getattr(dataset, name)
+
+
+if __name__ == "__main__":
+    for n_bins in [10000, 100000, 1000000]:
+        dataset = Dataset(np.arange(n_bins, dtype=float), np.full(n_bins, 0.5), np.ones(n_bins), None)
+        duration = min(timeit.repeat(lambda: build_edges(dataset), number=1, repeat=N_REPEATS))
+        print("{0:>8} bins {1:.4f}s".format(n_bins, duration))
@@ -0,0 +1,24 @@
+#! /usr/bin/env python
+"""Measure how long importing mATLASplotlib takes in a fresh interpreter, compared with a budget for the startup time."""
+import subprocess
+import sys
+import timeit
+
+N_REPEATS = 5
+
+# Budget for importing mATLASplotlib in a fresh interpreter, in seconds
+IMPORT_TIME_BUDGET = 3.0
+
+
+def time_command(code):
+    """Time running some code in a fresh interpreter."""
+    return min(timeit.repeat(lambda: subprocess.check_call([sys.executable, "-c", code]), number=1, repeat=N_REPEATS))
+
+
+if __name__ == "__main__":
+    interpreter_time = time_command("pass")
+    import_time = time_command("import mATLASplotlib")
+    print("Interpreter startup:   {0:.3f}s".format(interpreter_time))
+    print("import mATLASplotlib:  {0:.3f}s ({1:.3f}s for the import itself)".format(import_time, import_time - interpreter_time))
+    print("Budget:                {0:.3f}s ({1})".format(IMPORT_TIME_BUDGET, "within budget" if import_time < IMPORT_TIME_BUDGET else "OVER BUDGET"))
+    sys.exit(0 if import_time < IMPORT_TIME_BUDGET else 1)
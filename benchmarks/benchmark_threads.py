@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+"""Measure the throughput of render_many against the number of threads and processes, drawing the example figures.
+
+Threads hold a lock for the whole of drawing and saving each plot, so they are not expected to be faster than a single thread.
+Processes are the way to draw plots in parallel.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+import mATLASplotlib
+from mATLASplotlib.batch import PlotSpec, render_many
+
+N_PLOTS = 48
+N_REPEATS = 3
+
+
+def example_fig_01(output_name):
+    """Example fig_01 with numpy data in place of the ROOT histograms and fit."""
+    bin_centres = np.linspace(-4.0, 4.0, 41)[:-1] + 0.1
+    expected = 1000 * np.exp(-0.5 * bin_centres**2)
+    observed = np.random.poisson(expected)
+    spec = PlotSpec("Simple", output_name, extension=["png", "pdf"], shape="landscape")
+    spec.plot_dataset(bin_centres, np.full(40, 0.1), observed, np.sqrt(observed), style="scatter yerror", label="Data 2009", colour="black")
+    spec.plot_dataset(bin_centres, np.full(40, 0.1), expected, None, style="bar", label="Non-diffractive minimum bias", colour="#ffff00", edgecolour="black")
+    spec.plot_dataset(bin_centres, expected, style="smooth line", label="Gaussian fit", colour="red")
+    spec.add_legend(0.04, 0.92, fontsize=16, anchor_to="upper left")
+    spec.add_text(0.04, 0.60, r"$\mu = ({0:.2f}\pm{1:.2f})\,$ GeV".format(0.01, 0.01), fontsize=16)
+    spec.add_text(0.04, 0.54, r"$\sigma = ({0:.2f}\pm{1:.2f})\,$ GeV".format(1.0, 0.01), fontsize=16)
+    spec.add_ATLAS_label(0.96, 0.92, fontsize=20, plot_type="Preliminary", anchor_to="upper right")
+    spec.add_luminosity_label(0.96, 0.85, fontsize=20, sqrts_TeV=0.9, luminosity=None, anchor_to="upper right")
+    spec.set_axis_label("x", "$p_x$ [GeV]")
+    spec.set_axis_label("y", "Events / 0.2 GeV")
+    spec.set_axis_range("x", (-5.0, 5.0))
+    spec.set_axis_range("y", (0, 1200))
+    spec.set_axis_ticks("x", [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
+    return spec
+
+
+def example_fig_02(output_name):
+    """Example fig_02 with a falling spectrum in place of the NLO QCD prediction."""
+    x_values = np.arange(150, 7000, 100, dtype=float)
+    prediction = 6.6e6 * np.exp(-x_values / 100.0) + 1e3 * np.exp(-x_values / 300.0)
+    data = prediction * np.random.uniform(0.8, 1.2, size=len(x_values))
+    spec = PlotSpec("Simple", output_name, extension="png", shape="square")
+    spec.plot_dataset(x_values, np.full(len(x_values), 50.0), data, np.sqrt(data * 1000) / 200., style="scatter yerror", label="Data 2009", colour="black")
+    spec.plot_dataset(x_values, np.full(len(x_values), 50.0), prediction, 0.1 * prediction, style="binned band central line", label="NLO QCD", colour="#ffff00", linecolour="black")
+    spec.add_legend(0.45, 0.75, fontsize=20, anchor_to="upper left")
+    spec.add_luminosity_label(0.15, 0.9, fontsize=20, sqrts_TeV=14, luminosity=None, anchor_to="upper left")
+    spec.add_text(0.53, 0.9, r"$|\eta_{jet}| < 0.5$", fontsize=20, anchor_to="upper left")
+    spec.add_ATLAS_label(0.05, 0.05, fontsize=20, plot_type="Preliminary", anchor_to="lower left")
+    spec.set_axis_label("x", r"$E_{T,jet}$  [GeV]")
+    spec.set_axis_label("y", r"$d\sigma_{jet}/dE_{T,jet}$ [fb/GeV]")
+    spec.set_axis_range("x", (60.0, 3500.0))
+    spec.set_axis_range("y", (1e-3, 2e7))
+    spec.set_axis_log("y")
+    spec.set_axis_ticks("x", [500, 1000, 1500, 2000, 2500, 3000, 3500])
+    spec.set_axis_ticks("y", [1e-3, 1e-2, 1e-1, 1, 10, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7])
+    return spec
+
+
+if __name__ == "__main__":
+    output_directory = tempfile.mkdtemp()
+    specs = [(example_fig_01, example_fig_02)[idx % 2](os.path.join(output_directory, "plot{0}".format(idx))) for idx in range(N_PLOTS)]
+    mATLASplotlib.style.set_atlas()
+    print("Threads serialise drawing, so only processes are expected to scale with the number of workers ({0} CPUs available)".format(multiprocessing.cpu_count()))
+    for use_threads in [True, False]:
+        for n_workers in [1, 2, 4, 8]:
+            duration = float("inf")
+            for _ in range(N_REPEATS):
+                start = time.time()
+                render_many(specs, workers=n_workers, use_threads=use_threads)
+                duration = min(duration, time.time() - start)
+            print("{0} {1}: {2:.1f} plots/s".format(n_workers, "threads" if use_threads else "processes", N_PLOTS / duration))
+    shutil.rmtree(output_directory)
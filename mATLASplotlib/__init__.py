@@ -4,8 +4,9 @@ import logging
 import sys
 import matplotlib_wrapper
 import canvases
+import batch
 
-__all__ = ["canvases", "matplotlib_wrapper"]
+__all__ = ["batch", "canvases", "matplotlib_wrapper"]
 
 # Set up logging
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -0,0 +1,5 @@
+"""This subpackage contains the PlotSpec class and the render and render_many functions for drawing many plots at once."""
+from plot_spec import PlotSpec
+from render import render, render_many
+
+__all__ = ["PlotSpec", "render", "render_many"]
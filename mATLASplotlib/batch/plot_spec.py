@@ -0,0 +1,75 @@
+""" This module provides the ``PlotSpec`` class."""
+
+
+class PlotSpec(object):
+    """Declarative description of a single plot.
+
+    A ``PlotSpec`` records the same calls that would otherwise be made on a canvas, so that the plot can be drawn later,
+    possibly in another process. It can be pickled as long as the plotted data can, for example ``numpy`` arrays or
+    ``Dataset`` objects.
+
+    :Example:
+        .. code:: python
+
+            spec = PlotSpec("Simple", "output_name", extension=["pdf", "png"], shape="landscape")
+            spec.plot_dataset(x_values, y_values, style="scatter", label="Data")
+            spec.set_axis_label("x", "$m_{jj}$ [GeV]")
+            spec.set_axis_range("y", (0, 100))
+            spec.add_legend(0.6, 0.8)
+    """
+
+    #: Canvas types which can be used
+    canvas_types = ["Panelled", "Ratio", "Simple"]
+
+    #: Canvas methods which can be recorded
+    canvas_methods = ["add_ATLAS_label", "add_legend", "add_luminosity_label", "add_text", "plot_dataset",
+                      "set_axis_label", "set_axis_log", "set_axis_max", "set_axis_min", "set_axis_range",
+                      "set_axis_tick_ndp", "set_axis_ticks", "set_title"]
+
+    def __init__(self, canvas_type, output_name, extension="pdf", **kwargs):
+        """Set up a plot specification.
+
+        :param canvas_type: which canvas to use (one of ``canvas_types``)
+        :type canvas_type: str
+        :param output_name: name of the output file, without the extension
+        :type output_name: str
+        :param extension: type of output to produce
+        :type extension: str or list
+
+        :Keyword Arguments: passed to the canvas constructor, eg. ``shape`` or ``log_type``
+
+        :raises ValueError: unsupported canvas type
+        """
+        if canvas_type not in self.canvas_types:
+            raise ValueError("Canvas type '{0}' is not supported".format(canvas_type))
+        self.canvas_type = canvas_type
+        self.canvas_kwargs = kwargs
+        self.output_name = output_name
+        self.extension = extension
+        self.calls = []
+
+    def __getattr__(self, name):
+        """Provide recording versions of the canvas methods.
+
+        :param name: name of the canvas method
+        :type name: str
+        :return: function which records a call to this method
+        :rtype: callable
+        :raises AttributeError: no such canvas method can be recorded
+        """
+        if name not in self.canvas_methods:
+            raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, name))
+
+        def record_call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return record_call
+
+    def draw(self, canvas):
+        """Replay the recorded calls on a canvas.
+
+        :param canvas: canvas to draw on
+        :type canvas: BaseCanvas
+        """
+        for name, args, kwargs in self.calls:
+            getattr(canvas, name)(*args, **kwargs)
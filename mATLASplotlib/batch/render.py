@@ -0,0 +1,80 @@
+""" This module provides the ``render()`` and ``render_many()`` functions."""
+import logging
+import multiprocessing
+import multiprocessing.pool
+from .. import canvases, style
+
+logger = logging.getLogger("mATLASplotlib.batch")
+
+
+def render(spec):
+    """Draw a single plot and save it to file.
+
+    :param spec: plot to draw
+    :type spec: PlotSpec
+    :return: names of the files that were written
+    :rtype: list(str)
+    """
+    extensions = [spec.extension] if isinstance(spec.extension, str) else list(spec.extension)
+    with getattr(canvases, spec.canvas_type)(**spec.canvas_kwargs) as canvas:
+        spec.draw(canvas)
+        canvas.save(spec.output_name, extensions)
+    return ["{0}.{1}".format(spec.output_name, extension) for extension in extensions]
+
+
+def render_many(specs, workers=None, chunksize=1, use_threads=False):
+    """Draw many plots, sharing the work between several processes or threads.
+
+    Each worker reuses its figures through a :py:class:`.FigurePool`.
+    With a single worker the plots are drawn in this process instead.
+
+    Threads avoid copying the plotted data into each worker, which matters when it comes from large input files.
+    However, matplotlib shares fonts and its mathtext parser between figures, so each thread holds a lock for the whole
+    of drawing and saving a plot, and the rest of the work is limited by the GIL.
+    Threads therefore give no speed-up over drawing in a single thread: use processes (the default) to draw plots in parallel.
+
+    :param specs: plots to draw
+    :type specs: iterable(PlotSpec)
+    :param workers: number of processes or threads to use (defaults to the number of CPUs)
+    :type workers: int
+    :param chunksize: number of plots to send to a worker at a time
+    :type chunksize: int
+    :param use_threads: use a pool of threads rather than processes, which saves memory but not time
+    :type use_threads: bool
+    :return: names of the files written for each plot, in the same order as the input
+    :rtype: list(list(str))
+    """
+    specs = list(specs)
+    workers = min(multiprocessing.cpu_count() if workers is None else workers, max(len(specs), 1))
+    if workers <= 1:
+        with canvases.FigurePool():
+            return [render(spec) for spec in specs]
+    if use_threads:
+        logger.info("Rendering {0} plots with {1} threads".format(len(specs), workers))
+        worker_pool = multiprocessing.pool.ThreadPool(workers, initializer=_initialise_thread)
+    else:
+        logger.info("Rendering {0} plots with {1} processes".format(len(specs), workers))
+        worker_pool = multiprocessing.Pool(workers, initializer=_initialise_worker)
+    try:
+        output_names = worker_pool.map(render, specs, chunksize=chunksize)
+    finally:
+        worker_pool.close()
+        worker_pool.join()
+    return output_names
+
+
+def _initialise_worker():
+    """Prepare a worker process: apply the ATLAS style and start a figure pool which lasts for the lifetime of the process."""
+    from matplotlib import font_manager
+    # Open font files cannot be shared with the parent process, so clear any that were inherited from it
+    # (newer versions of matplotlib do this automatically)
+    if hasattr(getattr(font_manager, "_get_font", None), "cache_clear"):
+        font_manager._get_font.cache_clear()  # pylint: disable=protected-access
+    style.set_atlas()
+    canvases.FigurePool().__enter__()
+
+
+def _initialise_thread():
+    """Prepare a worker thread: apply the ATLAS style and start a figure pool which lasts for the lifetime of the thread."""
+    style.set_atlas()
+    canvases.FigurePool().__enter__()
@@ -0,0 +1,31 @@
+"""This module provides the ``BoundedCache`` class, which is shared by the caches used throughout mATLASplotlib."""
+
+
+class BoundedCache(dict):
+    """Dictionary which is cleared whenever a new key is added once it holds ``max_size`` entries.
+
+    This keeps memory use bounded for module-level caches which may see many different keys in a long-running process.
+    """
+
+    #: Default number of entries to hold before the cache is cleared
+    default_max_size = 1024
+
+    def __init__(self, max_size=None):
+        """Set up an empty cache.
+
+        :param max_size: number of entries to hold before clearing the cache (defaults to ``default_max_size``)
+        :type max_size: int
+        """
+        super(BoundedCache, self).__init__()
+        self.max_size = self.default_max_size if max_size is None else max_size
+
+    def __setitem__(self, key, value):
+        """Add a value to the cache, clearing the cache first if it is full.
+
+        :param key: key to store the value under
+        :type key: hashable
+        :param value: value to store
+        """
+        if key not in self and len(self) >= self.max_size:
+            self.clear()
+        super(BoundedCache, self).__setitem__(key, value)
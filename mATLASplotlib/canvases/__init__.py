@@ -1,6 +1,7 @@
 """This subpackage contains the various canvas types"""
+from figure_pool import FigurePool
 from panelled import Panelled
 from ratio import Ratio
 from simple import Simple
 
-__all__ = ["Panelled", "Ratio", "Simple"]
+__all__ = ["FigurePool", "Panelled", "Ratio", "Simple"]
@@ -0,0 +1,117 @@
+""" This module provides the ``AsyncWriter`` class."""
+import atexit
+import logging
+import sys
+import threading
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+logger = logging.getLogger("mATLASplotlib.canvases")
+
+if sys.version_info[0] >= 3:
+    def _reraise(exc_type, exc_value, exc_traceback):
+        """Re-raise an exception with its original traceback."""
+        raise exc_value.with_traceback(exc_traceback)
+else:  # Python 2
+    # The three-argument raise is a syntax error in Python 3
+    exec("def _reraise(exc_type, exc_value, exc_traceback):\n"
+         "    \"\"\"Re-raise an exception with its original traceback.\"\"\"\n"
+         "    raise exc_type, exc_value, exc_traceback\n")
+
+
+class AsyncWriter(object):
+    """Bounded pool of background threads which write in-memory outputs to disk.
+
+    Submitting a write blocks once ``max_pending`` writes are waiting, so that memory use stays bounded if the disk is slower than plotting.
+    Outstanding writes are finished when the interpreter exits.
+    """
+
+    #: Writer shared by all canvases which save asynchronously
+    __default_writer = None
+    __default_writer_lock = threading.Lock()
+
+    def __init__(self, n_threads=2, max_pending=16):
+        """Start the writer threads.
+
+        :param n_threads: number of writer threads
+        :type n_threads: int
+        :param max_pending: maximum number of writes which can be waiting before further submissions block
+        :type max_pending: int
+        """
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.threads = [threading.Thread(target=self.__write_outputs, name="mATLASplotlib-writer-{0}".format(idx)) for idx in range(n_threads)]
+        for thread in self.threads:
+            thread.daemon = True
+            thread.start()
+        # The writer threads are daemons, which would be stopped at exit without finishing the queued writes
+        atexit.register(self.flush)
+
+    @classmethod
+    def default(cls):
+        """Get the shared writer, starting it if necessary.
+
+        :return: shared writer
+        :rtype: AsyncWriter
+        """
+        with cls.__default_writer_lock:
+            if cls.__default_writer is None:
+                cls.__default_writer = cls()
+        return cls.__default_writer
+
+    def submit(self, file_name, contents):
+        """Queue contents to be written to a file.
+
+        :param file_name: name of the file to write
+        :type file_name: str
+        :param contents: bytes to write
+        :type contents: bytes
+        :return: handle which can be used to wait for this write to finish
+        :rtype: PendingWrite
+        """
+        pending_write = PendingWrite(file_name)
+        self.queue.put((pending_write, contents))
+        return pending_write
+
+    def flush(self):
+        """Wait for every queued write to finish."""
+        self.queue.join()
+
+    def __write_outputs(self):
+        """Write queued outputs until the process exits."""
+        while True:
+            pending_write, contents = self.queue.get()
+            try:
+                with open(pending_write.file_name, "wb") as f_output:
+                    f_output.write(contents)
+            except Exception:  # pylint: disable=broad-except
+                # Errors are stored so that they can be re-raised in the thread which is waiting for this write
+                pending_write.exc_info = sys.exc_info()
+            finally:
+                pending_write.finished.set()
+                self.queue.task_done()
+
+
+class PendingWrite(object):
+    """Handle for a write which has been submitted to an ``AsyncWriter``."""
+
+    def __init__(self, file_name):
+        """Set up an unfinished write.
+
+        :param file_name: name of the file being written
+        :type file_name: str
+        """
+        self.file_name = file_name
+        self.finished = threading.Event()
+        self.exc_info = None
+
+    def wait(self):
+        """Wait for the write to finish.
+
+        :raises IOError: the write failed (or any other exception raised while writing)
+        """
+        self.finished.wait()
+        if self.exc_info is not None:
+            _reraise(*self.exc_info)
+        logger.info("Saved figure to: {0}".format(self.file_name))
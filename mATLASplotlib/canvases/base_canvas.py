@@ -1,13 +1,17 @@
 """ This module provides the ``BaseCanvas`` canvas."""
+import io
 import logging
 import math
 import matplotlib
 import numpy as np
 from .. import style
 from ..converters import Dataset
-from ..formatters import force_extra_ticks
+from ..formatters import force_extra_ticks, get_auto_ticks, LogMinorLocator
+from ..matplotlib_wrapper import render_lock
 from ..plotters import get_plotter
 from ..decorations import draw_ATLAS_text, draw_text, Legend
+from async_writer import AsyncWriter
+from figure_pool import FigurePool, create_figure
 
 logger = logging.getLogger("mATLASplotlib.canvases")
 
@@ -29,6 +33,9 @@ class BaseCanvas(object):
                            0.1, 0.2, 0.25, 0.4, 0.5,
                            1.0, 2.0, 2.5, 4.0, 5.0]
 
+    #: Stages of the plot finalisation, in the order that they are applied
+    finalisation_stages = ["limits", "locators", "formatters", "header", "final"]
+
     def __init__(self, shape="square", **kwargs):
         """Set up universal canvas properties.
 
@@ -42,12 +49,22 @@ class BaseCanvas(object):
             * **x_tick_label_size** (*float*) -- fontsize for x-axis tick labels
             * **y_tick_labels** (*iterable*) -- list of tick labels for the y-axis
             * **y_tick_label_size** (*float*) -- fontsize for y-axis tick labels
+            * **async_save** (*bool*) -- write outputs to disk in the background (see :py:meth:`save`)
+
+        The canvas owns its figure, which is not registered with pyplot, so separate canvases can be built concurrently.
+        If a :py:class:`.FigurePool` is active then the figure is taken from it rather than being newly created.
         """
         # Set ATLAS style
         style.set_atlas()
         # Set up figure
         n_pixels = {"square": (600, 600), "landscape": (800, 600), "portrait": (600, 800)}[shape]
-        self.figure = matplotlib.pyplot.figure(figsize=(n_pixels[0] / 100.0, n_pixels[1] / 100.0), dpi=100, facecolor="white")
+        figure_size = (n_pixels[0] / 100.0, n_pixels[1] / 100.0)
+        self.figure_pool, self.figure_key = FigurePool.active(), self._get_figure_key(shape)
+        if self.figure_pool is not None:
+            self.figure, self._reusable_axes = self.figure_pool.acquire(self.figure_key, figure_size)
+        else:
+            self.figure, self._reusable_axes = create_figure(figure_size), []
+        self.figure_axes = []
         self.main_subplot = None
         # Set properties from arguments
         self.log_type = kwargs.get("log_type", "")
@@ -60,6 +77,18 @@ class BaseCanvas(object):
         self.axis_tick_ndps = {}
         self.subplots = {}
         self.internal_header_fraction = None
+        self.__finalised_inputs = {}
+        self.__finalised_version = None
+        self.__header_base_ylim = None
+        # Set up asynchronous output writing
+        self.async_save = kwargs.get("async_save", False)
+        self.pending_writes = []
+
+    def __setattr__(self, name, value):
+        """Set an attribute, counting any change to a public attribute as a modification of the canvas state."""
+        super(BaseCanvas, self).__setattr__(name, value)
+        if not name.startswith("_"):
+            self._mark_modified()
 
     def __enter__(self):
         """Enter the runtime context related to this object.
@@ -71,8 +100,23 @@ class BaseCanvas(object):
         """Exit the runtime context related to this object.
         The parameters describe the exception that caused the context to be exited.
         If the context was exited without an exception, all three arguments will be ``None``.
+
+        Any outputs which are still being written are waited for first.
+        Errors from these writes are raised here, unless the context is already being exited because of an exception.
         """
-        matplotlib.pyplot.close(self.figure)
+        try:
+            self.wait_for_outputs()
+        except Exception:  # pylint: disable=broad-except
+            if not args or args[0] is None:
+                raise
+            logger.exception("Failed to write output while handling another exception")
+        finally:
+            self.__release_figure()
+
+    def __release_figure(self):
+        """Return the figure to its pool, if there is one."""
+        if self.figure_pool is not None:
+            self.figure_pool.release(self.figure_key, self.figure, self.figure_axes)
 
     def plot_dataset(self, *args, **kwargs):
         """Plot a dataset.
@@ -80,10 +124,12 @@ class BaseCanvas(object):
         Keyword arguments will be interpreted as style arguments.
 
         :Positional Arguments:
-            * **args**: (*ROOT.TObject*, *iterable*, *numpy array*) -- plottable information which is passed to `Dataset` to be interpreted
+            * **args**: (*ROOT.TObject*, *uproot object*, *iterable*, *numpy array*) -- plottable information which is passed to `Dataset` to be interpreted
 
         :Keyword Arguments:
             * **remove_zeros**: (*bool*) -- prune any points in the dataset for which the y-value is 0
+            * **n_samples**: (*int*) -- (maximum) number of points at which to sample ROOT functions
+            * **adaptive_sampling**: (*bool*) -- concentrate ROOT function samples in regions of high curvature
             * **axes**: (*str*) -- which axes to use (defaults to the main subplot)
             * **style**: (*str*) -- which of the plotters in `plotters` to use
             * **label**: (*str*) -- label to use in automatic legend generation
@@ -92,7 +138,9 @@ class BaseCanvas(object):
         subplot_name = kwargs.pop("axes", self.main_subplot)
         plot_style = kwargs.pop("style", None)
         remove_zeros = kwargs.pop("remove_zeros", False)
-        dataset = Dataset(*args, remove_zeros=remove_zeros, **kwargs)
+        # Sampling arguments are only used to interpret the dataset so they are not passed on to the plotter
+        sampling_kwargs = dict((key, kwargs.pop(key)) for key in ["n_samples", "adaptive_sampling"] if key in kwargs)
+        dataset = Dataset(*args, remove_zeros=remove_zeros, **dict(kwargs, **sampling_kwargs))
         plotter = get_plotter(plot_style)
         if "label" in kwargs:
             self.legend.add_dataset(label=kwargs["label"], is_stack=("stack" in plot_style), sort_as=kwargs.pop("sort_as", None))
@@ -175,20 +223,53 @@ class BaseCanvas(object):
         anchor_to = kwargs.pop("anchor_to", "lower left")
         draw_text(text, self.subplots[subplot_name], (x, y), self.location_map[anchor_to], **kwargs)
 
-    def save(self, output_name, extension="pdf"):
+    def save(self, output_name, extension="pdf", dpi=None):
         """Save the current state of the canvas to a file.
 
+        The plot formatting is finalised once for all outputs.
+        Later saves reuse this finalised figure unless the canvas has been modified in the meantime (see :py:attr:`state_version`).
+        Each output format is then rendered separately by its own backend: in particular every vector format (eg. pdf or eps) is drawn from scratch.
+
+        If this canvas was created with ``async_save`` then each output is encoded in memory and written to disk by a background thread.
+        Use :py:meth:`wait_for_outputs` (called automatically when the canvas is closed) to wait for these writes to finish.
+
         :param output_name: name of output file.
         :type output_name: str
         :param extension: type of output to produce.
         :type extension: str or list
+        :param dpi: resolution in dots per inch, either for all outputs or as a dictionary of resolutions for each extension (defaults to the ``savefig.dpi`` setting).
+        :type dpi: float or dict
         """
         self.__finalise_plot_formatting()
         if isinstance(extension, str):
             extension = [extension]
+        default_dpi = self.figure.dpi if matplotlib.rcParams["savefig.dpi"] == "figure" else matplotlib.rcParams["savefig.dpi"]
+        output_dpis = dpi if isinstance(dpi, dict) else dict((output, dpi) for output in extension)
+        output_dpis = dict((output, default_dpi if output_dpis.get(output, None) is None else output_dpis[output]) for output in extension)
         for output in extension:
-            matplotlib.pyplot.savefig("{0}.{1}".format(output_name, output))
-            logger.info("Saved figure to: {0}.{1}".format(output_name, output))
+            output_dpi, file_name = output_dpis[output], "{0}.{1}".format(output_name, output)
+            target = io.BytesIO() if self.async_save else file_name
+            with render_lock:
+                self.figure.savefig(target, format=output, dpi=output_dpi)
+            if self.async_save:
+                self.pending_writes.append(AsyncWriter.default().submit(file_name, target.getvalue()))
+            else:
+                logger.info("Saved figure to: {0}".format(file_name))
+
+    def wait_for_outputs(self):
+        """Wait for any outputs which are being written in the background.
+
+        :raises IOError: an output could not be written (the first such error is raised once all writes have finished)
+        """
+        pending_writes, self.pending_writes = self.pending_writes, []
+        errors = []
+        for pending_write in pending_writes:
+            try:
+                pending_write.wait()
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+        if errors:
+            raise errors[0]
 
     def close(self):
         """Close the figure to free up memory.
@@ -256,6 +337,7 @@ class BaseCanvas(object):
         :type ndp: int
         """
         self.axis_tick_ndps[axis_name] = ndp
+        self._mark_modified()
 
     def set_axis_log(self, axis_names):
         """Set the specified axis to be on a log-scale.
@@ -294,52 +376,158 @@ class BaseCanvas(object):
         return self.tick_labels["y"][1]
 
     def __finalise_plot_formatting(self):
-        """Finalise plot by applying previously requested formatting."""
-        for _, subplot in self.subplots.items():
-            # Apply axis limits
+        """Finalise plot by applying previously requested formatting.
+
+        This is done in stages (see ``finalisation_stages``), each of which is applied once to every subplot.
+        A stage is skipped if its inputs are unchanged since it was last applied and no earlier stage has been applied again.
+        Nothing is done if the canvas state has not been modified since the last time the plot was finalised.
+        """
+        if self.__finalised_version == self.state_version:
+            return
+        stage_inputs = self._get_finalisation_inputs()
+        rerun = False
+        for stage_name in self.finalisation_stages:
+            if rerun or self.__finalised_inputs.get(stage_name, None) != _freeze(stage_inputs[stage_name]):
+                self.__apply_finalisation_stage(stage_name)
+                # Record the inputs after applying the stage, since stages may update the canvas state themselves
+                self.__finalised_inputs[stage_name] = _freeze(self._get_finalisation_inputs()[stage_name])
+                rerun = True
+        # Any modifications made by the stages themselves are part of the finalised state
+        self.__finalised_version = self.state_version
+
+    def __apply_finalisation_stage(self, stage_name):
+        """Apply a single stage of the plot finalisation.
+
+        :param stage_name: which of the ``finalisation_stages`` to apply
+        :type stage_name: str
+        """
+        if stage_name == "limits":
+            self.__apply_axis_limits()
+        elif stage_name == "locators":
+            for subplot in self.subplots.values():
+                self.__apply_locators(subplot)
+            # Apply the limits again on log-scale axes, where matplotlib ignores non-positive limits
+            if self.log_type:
+                self.__apply_axis_limits()
+        elif stage_name == "formatters":
+            for subplot in self.subplots.values():
+                self.__apply_formatters(subplot)
+        elif stage_name == "header":
+            self.__apply_internal_header()
+        elif stage_name == "final":
+            self._apply_final_formatting()
+
+    def __apply_axis_limits(self):
+        """Apply the previously defined axis limits to every subplot."""
+        if self.subplots:
             self._apply_axis_limits()
-            # Draw x ticks
-            if self.x_tick_labels is not None:
-                x_interval = (max(subplot.get_xlim()) - min(subplot.get_xlim())) / (len(self.x_tick_labels))
-                subplot.xaxis.set_major_locator(matplotlib.ticker.MultipleLocator(x_interval))
-                tmp_kwargs = {"fontsize": self.x_tick_label_size} if self.x_tick_label_size is not None else {}
-                subplot.set_xticklabels([""] + self.x_tick_labels, **tmp_kwargs)  # the first and last ticks are off the scale so add a dummy label
-            # Draw y ticks
-            if self.y_tick_labels is not None:
-                y_interval = (max(subplot.get_ylim()) - min(subplot.get_ylim())) / (len(self.y_tick_labels))
-                subplot.yaxis.set_major_locator(matplotlib.ticker.MultipleLocator(y_interval))
-                tmp_kwargs = {"fontsize": self.y_tick_label_size} if self.y_tick_label_size is not None else {}
-                subplot.set_yticklabels([""] + self.y_tick_labels, **tmp_kwargs)  # the first and last ticks are off the scale so add a dummy label
-
-            # Set x-axis locators
-            if "x" in self.log_type:
-                xlocator = subplot.xaxis.get_major_locator()
-                subplot.set_xscale("log", subsx=[2, 3, 4, 5, 6, 7, 8, 9])
-                subplot.yaxis.set_major_locator(xlocator)
-                subplot.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
-                subplot.xaxis.set_minor_formatter(matplotlib.ticker.FuncFormatter(force_extra_ticks(self.x_ticks_extra)))  # only show certain minor labels
-            else:
-                subplot.xaxis.set_minor_locator(matplotlib.ticker.AutoMinorLocator())
-            # Set y-axis locators
-            if "y" in self.log_type:
-                locator = subplot.yaxis.get_major_locator()
-                subplot.set_yscale("log")
-                subplot.yaxis.set_major_locator(locator)
-                fixed_minor_points = [10**x * val for x in range(-100, 100) for val in [2, 3, 4, 5, 6, 7, 8, 9]]
-                subplot.yaxis.set_minor_locator(matplotlib.ticker.FixedLocator(fixed_minor_points))
-            else:
-                subplot.yaxis.set_minor_locator(matplotlib.ticker.AutoMinorLocator())
+            # Record the y-range before the internal header is added, so that the header can be applied again
+            self.__header_base_ylim = self.subplots[self.main_subplot].get_ylim()
+
+    def __apply_locators(self, subplot):
+        """Set the axis scales and tick locators for one subplot.
+
+        :param subplot: subplot to apply this to
+        :type subplot: matplotlib.axes.Axes
+        """
+        # Space the x and y ticks evenly if they have labels
+        if self.x_tick_labels is not None:
+            x_interval = (max(subplot.get_xlim()) - min(subplot.get_xlim())) / (len(self.x_tick_labels))
+            subplot.xaxis.set_major_locator(matplotlib.ticker.MultipleLocator(x_interval))
+        if self.y_tick_labels is not None:
+            y_interval = (max(subplot.get_ylim()) - min(subplot.get_ylim())) / (len(self.y_tick_labels))
+            subplot.yaxis.set_major_locator(matplotlib.ticker.MultipleLocator(y_interval))
+        # Set x-axis locators
+        if "x" in self.log_type:
+            xlocator = subplot.xaxis.get_major_locator()
+            subplot.set_xscale("log", subsx=[2, 3, 4, 5, 6, 7, 8, 9])
+            subplot.yaxis.set_major_locator(xlocator)
+        else:
+            subplot.xaxis.set_minor_locator(matplotlib.ticker.AutoMinorLocator())
+        # Set y-axis locators
+        if "y" in self.log_type:
+            locator = subplot.yaxis.get_major_locator()
+            subplot.set_yscale("log")
+            subplot.yaxis.set_major_locator(locator)
+            subplot.yaxis.set_minor_locator(LogMinorLocator(subs=[2, 3, 4, 5, 6, 7, 8, 9]))
+        else:
+            subplot.yaxis.set_minor_locator(matplotlib.ticker.AutoMinorLocator())
 
-        # Finish by adding internal header
+    def __apply_formatters(self, subplot):
+        """Set the tick labels and formatters for one subplot.
+
+        :param subplot: subplot to apply this to
+        :type subplot: matplotlib.axes.Axes
+        """
+        # Draw x ticks (on log-scale axes these are replaced by the log formatters)
+        if "x" in self.log_type:
+            subplot.xaxis.set_major_formatter(matplotlib.ticker.ScalarFormatter())
+            subplot.xaxis.set_minor_formatter(matplotlib.ticker.FuncFormatter(force_extra_ticks(self.x_ticks_extra)))  # only show certain minor labels
+        elif self.x_tick_labels is not None:
+            tmp_kwargs = {"fontsize": self.x_tick_label_size} if self.x_tick_label_size is not None else {}
+            subplot.set_xticklabels([""] + self.x_tick_labels, **tmp_kwargs)  # the first and last ticks are off the scale so add a dummy label
+        # Draw y ticks
+        if "y" not in self.log_type and self.y_tick_labels is not None:
+            tmp_kwargs = {"fontsize": self.y_tick_label_size} if self.y_tick_label_size is not None else {}
+            subplot.set_yticklabels([""] + self.y_tick_labels, **tmp_kwargs)  # the first and last ticks are off the scale so add a dummy label
+
+    def __apply_internal_header(self):
+        """Extend the y-axis of the main subplot to leave space for an internal header."""
         if self.internal_header_fraction is not None:
-            y_lo, y_hi = self.subplots[self.main_subplot].get_ylim()
+            y_lo, y_hi = self.__header_base_ylim
             y_top = (y_hi - self.internal_header_fraction * y_lo) / (1.0 - self.internal_header_fraction)
             if "y" in self.log_type:
                 y_top = math.exp((math.log(y_hi) - self.internal_header_fraction * math.log(y_lo)) / (1.0 - self.internal_header_fraction))
             self.subplots[self.main_subplot].set_ylim(y_lo, y_top)
 
-        # Call child formatter if available
-        self._apply_final_formatting()
+    @property
+    def state_version(self):
+        """Counter which increases whenever the canvas state is modified.
+        This covers assignments to public attributes and changes made through the ``set_axis_*`` methods, but not changes made directly to the matplotlib axes.
+        """
+        return getattr(self, "_state_version", 0)
+
+    def _mark_modified(self):
+        """Record that the canvas state has been modified, so that the plot formatting will be checked again on the next save."""
+        self._state_version = self.state_version + 1
+
+    def _get_finalisation_inputs(self):
+        """Get the canvas state which each stage of the plot finalisation depends on.
+        Canvases which use more state in :py:meth:`_apply_final_formatting` should add it to the ``final`` entry.
+
+        :return: inputs for each of the ``finalisation_stages``
+        :rtype: dict
+        """
+        return {"limits": self.axis_ranges,
+                "locators": (self.log_type, self.tick_labels),
+                "formatters": (self.log_type, self.tick_labels, self.x_ticks_extra),
+                "header": (self.log_type, self.internal_header_fraction),
+                "final": (self.log_type, self.axis_tick_ndps)}
+
+    def _add_axes(self, subplot_name, dimensions):
+        """Add a set of axes to the figure, reusing existing axes if the figure came from a pool.
+
+        :param subplot_name: name to store the axes under in ``subplots``
+        :type subplot_name: str
+        :param dimensions: position of the axes as [left, bottom, width, height] fractions of the figure
+        :type dimensions: iterable
+        """
+        if self._reusable_axes:
+            self.subplots[subplot_name] = self._reusable_axes.pop(0)
+            self.subplots[subplot_name].set_position(dimensions)
+        else:
+            self.subplots[subplot_name] = self.figure.add_axes(dimensions)
+        self.figure_axes.append(self.subplots[subplot_name])
+
+    def _get_figure_key(self, shape):
+        """Get the key used to identify interchangeable figures in a :py:class:`.FigurePool`.
+
+        :param shape: canvas shape
+        :type shape: str
+        :return: key containing the canvas type and anything else that determines its layout
+        :rtype: tuple
+        """
+        return (type(self).__name__, shape)
 
     def _apply_axis_limits(self):
         """Apply the previously defined axis limits."""
@@ -382,10 +570,19 @@ class BaseCanvas(object):
         :return: list of tick positions
         :rtype: list
         """
-        # Underestimate the interval size since we might be removing the highest tick
-        interval = 0.99 * abs(self.axis_ranges[axis_name][1] - self.axis_ranges[axis_name][0])
-        tick_size = min(self.auto_tick_intervals, key=lambda x: abs((interval / x) - n_approximate))
-        tick_list = np.arange(1.0 - 10 * tick_size, 1.0 + 10 * tick_size, tick_size)
-        # Remove topmost tick if it would be at the top of the axis
-        tick_list = [t for t in tick_list if not np.allclose(t, self.axis_ranges[axis_name][1])]
-        return tick_list
+        return get_auto_ticks(self.axis_ranges[axis_name], self.auto_tick_intervals, n_approximate)
+
+
+def _freeze(value):
+    """Make an immutable copy of some canvas state, which can be compared with a later copy using ``==``.
+
+    :param value: state to copy
+    :type value: dict, list, tuple, np.array or any immutable type
+    :return: immutable copy
+    :rtype: tuple or immutable type
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    return value
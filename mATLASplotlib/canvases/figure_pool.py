@@ -0,0 +1,167 @@
+""" This module provides the ``FigurePool`` class."""
+import logging
+import threading
+
+logger = logging.getLogger("mATLASplotlib.canvases")
+
+
+class FigurePool(object):
+    """Pool of figures which are reused by successive canvases rather than being recreated for each one.
+
+    Figures are keyed by canvas type, shape and layout so a canvas is only ever given a figure with an identical set of axes.
+    When a canvas is closed its figure is returned to the pool and its axes are cleared ready for the next canvas of the same kind.
+    Each thread has its own active pool, so canvases being built in different threads never share a figure.
+
+    :Example:
+        .. code:: python
+
+            with mATLASplotlib.canvases.FigurePool():
+                for name, histogram in histograms:
+                    with mATLASplotlib.canvases.Simple(shape="landscape") as canvas:
+                        canvas.plot_dataset(histogram, style="scatter")
+                        canvas.save(name)
+    """
+
+    # Pools used by any canvases which are currently being created, separately for each thread
+    __active_pools = threading.local()
+
+    def __init__(self):
+        """Set up an empty pool."""
+        self.idle_figures = {}
+        self.all_figures = []
+        self.is_open = False
+        self.__previous_pool = None
+
+    def __enter__(self):
+        """Enter batch mode: canvases created inside this context will take their figures from this pool.
+
+        :return: this pool
+        :rtype: FigurePool
+        """
+        self.__previous_pool, FigurePool.__active_pools.pool = FigurePool.active(), self
+        self.is_open = True
+        return self
+
+    def __exit__(self, *args):
+        """Leave batch mode and close all figures owned by this pool."""
+        FigurePool.__active_pools.pool = self.__previous_pool
+        self.close()
+
+    @classmethod
+    def active(cls):
+        """Get the pool used by canvases created in the current thread.
+
+        :return: active pool, or None if there is no active pool in this thread
+        :rtype: FigurePool
+        """
+        return getattr(cls.__active_pools, "pool", None)
+
+    def acquire(self, key, figure_size):
+        """Get a figure for a new canvas, reusing an idle one if possible.
+
+        :param key: identifier for the canvas type, shape and layout
+        :type key: tuple
+        :param figure_size: size of the figure in inches
+        :type figure_size: tuple
+        :return: figure and a list of existing axes which the canvas should reuse, in the order they were created
+        :rtype: (matplotlib.figure.Figure, list(matplotlib.axes.Axes))
+        """
+        if self.idle_figures.get(key, []):
+            figure, axes_list = self.idle_figures[key].pop()
+            _reset_figure(figure, axes_list)
+            # Saving can change the figure resolution, so restore it
+            figure.set_dpi(100)
+            figure.set_size_inches(figure_size)
+            return figure, axes_list
+        figure = create_figure(figure_size)
+        self.all_figures.append(figure)
+        return figure, []
+
+    def release(self, key, figure, axes_list):
+        """Return a figure to the pool once its canvas is finished with it.
+
+        :param key: identifier for the canvas type, shape and layout
+        :type key: tuple
+        :param figure: figure to return
+        :type figure: matplotlib.figure.Figure
+        :param axes_list: axes used by the canvas, in the order they were created
+        :type axes_list: list(matplotlib.axes.Axes)
+        """
+        # Figures released after the pool is closed are simply dropped
+        if self.is_open:
+            # Ignore figures which have already been released
+            if all(figure is not idle_figure for idle_figure, _ in self.idle_figures.get(key, [])):
+                self.idle_figures.setdefault(key, []).append((figure, list(axes_list)))
+
+    def close(self):
+        """Release all figures owned by this pool so that they can be garbage collected."""
+        logger.debug("Closed {0} pooled figures".format(len(self.all_figures)))
+        self.idle_figures, self.all_figures = {}, []
+        self.is_open = False
+
+
+def create_figure(figure_size):
+    """Create a figure which is drawn with the Agg renderer and is not registered with pyplot.
+
+    The figure is owned entirely by its caller, so figures can be created and drawn in several threads at once.
+    Vector outputs are still available through ``savefig``, which switches to the appropriate backend for each format.
+
+    :param figure_size: size of the figure in inches
+    :type figure_size: tuple
+    :return: new figure
+    :rtype: matplotlib.figure.Figure
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=figure_size, dpi=100, facecolor="white")
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _reset_figure(figure, axes_list):
+    """Remove everything drawn on a figure, keeping the axes that belong to its canvas.
+
+    :param figure: figure to reset
+    :type figure: matplotlib.figure.Figure
+    :param axes_list: axes to keep
+    :type axes_list: list(matplotlib.axes.Axes)
+    """
+    # Remove any axes added while plotting, such as colour bars
+    for axes in [_axes for _axes in figure.axes if _axes not in axes_list]:
+        figure.delaxes(axes)
+    for axes in axes_list:
+        _reset_axes(axes)
+    for artist in figure.texts + figure.legends + figure.artists + figure.lines + figure.patches + figure.images:
+        artist.remove()
+
+
+def _reset_axes(axes):
+    """Return axes to their initial state, keeping their tick objects so that these do not need to be recreated.
+
+    :param axes: axes to reset
+    :type axes: matplotlib.axes.Axes
+    """
+    import matplotlib
+    # Remove plotted artists and decorations
+    for artist in axes.lines + axes.patches + axes.collections + axes.texts + axes.images + axes.artists + axes.tables:
+        artist.remove()
+    del axes.containers[:]
+    axes.legend_ = None
+    axes.set_title("")
+    axes.set_prop_cycle(None)
+    # Remove state stored on the axes by plotters
+    if hasattr(axes, "stack_bottom"):
+        del axes.stack_bottom
+    # Restore scales (which also restores the default locators and formatters), limits and labels
+    axes.set_xscale("linear")
+    axes.set_yscale("linear")
+    axes.ignore_existing_data_limits = True
+    axes.set_xlim(0, 1)
+    axes.set_ylim(0, 1)
+    axes.set_autoscale_on(True)
+    axes.set_aspect("auto")
+    axes.set_anchor("C")
+    for axis, axis_name in [(axes.xaxis, "xtick"), (axes.yaxis, "ytick")]:
+        axis.set_label_text("")
+        axis.set_tick_params(which="major", labelsize=matplotlib.rcParams["{0}.labelsize".format(axis_name)])
+        axis.set_tick_params(which="minor", labelsize=matplotlib.rcParams["{0}.labelsize".format(axis_name)])
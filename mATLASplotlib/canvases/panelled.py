@@ -22,14 +22,15 @@ class Panelled(BaseCanvas):
 
         :Keyword Arguments: as for :py:class:`.BaseCanvas`
         """
+        self.n_panels = n_panels
+        self.top_panel_fraction = top_panel_fraction
         super(Panelled, self).__init__(shape=shape, **kwargs)
         _margin_top, _margin_bottom = 0.02, 0.08
-        self.n_panels = n_panels
         subplot_height = (1.0 - _margin_top - _margin_bottom - top_panel_fraction) / self.n_panels
-        self.subplots["top"] = self.figure.add_axes([0.15, 1.0 - _margin_top - top_panel_fraction, 0.8, top_panel_fraction])
+        self._add_axes("top", [0.15, 1.0 - _margin_top - top_panel_fraction, 0.8, top_panel_fraction])
         for idx in range(n_panels):
             _panel_limits = [0.15, (1.0 - _margin_top - top_panel_fraction - (idx + 1) * subplot_height), 0.8, subplot_height]
-            self.subplots["plot{0}".format(idx)] = self.figure.add_axes(_panel_limits)
+            self._add_axes("plot{0}".format(idx), _panel_limits)
             self.axis_ranges["y_plot{0}".format(idx)] = [0.5, 1.5]
         self.use_auto_ratio_ticks = dict((name, True) for name in self.subplots if name != "top")
         self.main_subplot = "plot0"
@@ -43,6 +44,9 @@ class Panelled(BaseCanvas):
             y_axis_name = "y_{0}".format(subplot_name)
             self.set_axis_range(y_axis_name, self.subplots[subplot_name].get_ylim())
 
+    def _get_figure_key(self, shape):
+        return super(Panelled, self)._get_figure_key(shape) + (self.n_panels, self.top_panel_fraction)
+
     def add_legend(self, x, y, anchor_to="lower left", fontsize=None, axes=None):
         """Add a legend to the canvas at (x, y).
 
@@ -78,6 +82,7 @@ class Panelled(BaseCanvas):
     def set_axis_max(self, axis_name, maximum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (self.axis_ranges[axis_name][0], maximum)
+            self._mark_modified()
         if axis_name == "x":
             for subplot in self.subplots.values():
                 subplot.set_xlim(right=maximum)
@@ -89,6 +94,7 @@ class Panelled(BaseCanvas):
     def set_axis_min(self, axis_name, minimum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (minimum, self.axis_ranges[axis_name][1])
+            self._mark_modified()
         if axis_name == "x":
             for subplot in self.subplots.values():
                 subplot.set_xlim(left=minimum)
@@ -104,6 +110,7 @@ class Panelled(BaseCanvas):
             self.axis_ranges[axis_name] = axis_range
         else:
             raise ValueError("axis {0} not recognised by {1}".format(axis_name, type(self)))
+        self._mark_modified()
 
     def set_axis_ticks(self, axis_name, ticks):
         if axis_name == "x":
@@ -113,6 +120,7 @@ class Panelled(BaseCanvas):
             subplot_name = axis_name.replace("y_", "")
             self.subplots[subplot_name].yaxis.set_major_locator(FixedLocator(ticks))
             self.use_auto_ratio_ticks[subplot_name] = False
+            self._mark_modified()
         else:
             raise ValueError("axis {0} not recognised by {1}".format(axis_name, type(self)))
 
@@ -127,6 +135,11 @@ class Panelled(BaseCanvas):
             if "y_plot" in axis_name:
                 self.subplots[axis_name.replace("y_", "")].set_ylim(self.axis_ranges[axis_name])
 
+    def _get_finalisation_inputs(self):
+        finalisation_inputs = super(Panelled, self)._get_finalisation_inputs()
+        finalisation_inputs["final"] += (self.axis_ranges, self.use_auto_ratio_ticks)
+        return finalisation_inputs
+
     def _apply_final_formatting(self):
         """Apply final formatting. Remove unnecessary ticks and labels."""
         # Set axis decimal places
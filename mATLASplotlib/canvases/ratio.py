@@ -20,12 +20,13 @@ class Ratio(BaseCanvas):
         :Keyword Arguments: as for :py:class:`.BaseCanvas`
         """
         super(Ratio, self).__init__(shape=shape, **kwargs)
-        self.subplots["top"] = self.figure.add_axes([0.15, 0.35, 0.8, 0.6])
-        self.subplots["bottom"] = self.figure.add_axes([0.15, 0.1, 0.8, 0.25])
+        self._add_axes("top", [0.15, 0.35, 0.8, 0.6])
+        self._add_axes("bottom", [0.15, 0.1, 0.8, 0.25])
         self.line_ypos = line_ypos
         self.main_subplot = "top"
         self.axis_ranges["y_ratio"] = [0.5, 1.5]
         self.use_auto_ratio_ticks = True
+        self.__reference_line = None
 
     def plot_dataset(self, *args, **kwargs):
         subplot_name = kwargs.get("axes", self.main_subplot)
@@ -66,6 +67,7 @@ class Ratio(BaseCanvas):
     def set_axis_max(self, axis_name, maximum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (self.axis_ranges[axis_name][0], maximum)
+            self._mark_modified()
         if axis_name == "x":
             self.subplots["top"].set_xlim(right=maximum)
             self.subplots["bottom"].set_xlim(right=maximum)
@@ -79,6 +81,7 @@ class Ratio(BaseCanvas):
     def set_axis_min(self, axis_name, minimum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (minimum, self.axis_ranges[axis_name][1])
+            self._mark_modified()
         if axis_name == "x":
             self.subplots["top"].set_xlim(left=minimum)
             self.subplots["bottom"].set_xlim(left=minimum)
@@ -98,6 +101,7 @@ class Ratio(BaseCanvas):
             self.axis_ranges["y_ratio"] = axis_range
         else:
             raise ValueError("axis {0} not recognised by {1}".format(axis_name, type(self)))
+        self._mark_modified()
 
     def set_axis_ticks(self, axis_name, ticks):
         if axis_name == "x":
@@ -123,12 +127,22 @@ class Ratio(BaseCanvas):
         if "y_ratio" in self.axis_ranges:
             self.subplots["bottom"].set_ylim(self.axis_ranges["y_ratio"])
 
+    def _get_finalisation_inputs(self):
+        finalisation_inputs = super(Ratio, self)._get_finalisation_inputs()
+        finalisation_inputs["final"] += (self.axis_ranges, self.line_ypos, self.use_auto_ratio_ticks)
+        return finalisation_inputs
+
     def _apply_final_formatting(self):
         """Apply final formatting. Draw line at y = line_ypos"""
-        self.subplots["bottom"].add_line(Line2D(self.subplots["bottom"].get_xlim(),
-                                                [self.line_ypos, self.line_ypos],
-                                                transform=self.subplots["bottom"].transData,
-                                                linewidth=1, linestyle="--", color="black"))
+        # Move the existing line if the formatting is applied again
+        if self.__reference_line is None:
+            self.__reference_line = Line2D(self.subplots["bottom"].get_xlim(),
+                                           [self.line_ypos, self.line_ypos],
+                                           transform=self.subplots["bottom"].transData,
+                                           linewidth=1, linestyle="--", color="black")
+            self.subplots["bottom"].add_line(self.__reference_line)
+        else:
+            self.__reference_line.set_data(self.subplots["bottom"].get_xlim(), [self.line_ypos, self.line_ypos])
 
         # Set axis decimal places
         for axis_name, ndp in self.axis_tick_ndps.items():
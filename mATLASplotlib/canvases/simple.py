@@ -13,7 +13,7 @@ class Simple(BaseCanvas):
                       "portrait": {"dimensions": (0.12, 0.1, 0.84, 0.85), "y_label_offset": -0.13}}
         self.shape_dict = shape_dict[shape]
         super(Simple, self).__init__(shape=shape, **kwargs)
-        self.subplots["main"] = self.figure.add_axes(self.shape_dict["dimensions"])
+        self._add_axes("main", self.shape_dict["dimensions"])
         self.main_subplot = "main"
 
     def plot_dataset(self, *args, **kwargs):
@@ -61,6 +61,7 @@ class Simple(BaseCanvas):
     def set_axis_max(self, axis_name, maximum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (self.axis_ranges[axis_name][0], maximum)
+            self._mark_modified()
         if axis_name == "x":
             self.subplots["main"].set_xlim(right=maximum)
         elif axis_name == "y":
@@ -71,6 +72,7 @@ class Simple(BaseCanvas):
     def set_axis_min(self, axis_name, minimum):
         if axis_name in self.axis_ranges:
             self.axis_ranges[axis_name] = (minimum, self.axis_ranges[axis_name][1])
+            self._mark_modified()
         if axis_name == "x":
             self.subplots["main"].set_xlim(left=minimum)
         elif axis_name == "y":
@@ -85,6 +87,7 @@ class Simple(BaseCanvas):
             self.axis_ranges["y"] = tuple(axis_range)
         else:
             raise ValueError("axis {0} not recognised by {1}".format(axis_name, type(self)))
+        self._mark_modified()
 
     def set_axis_ticks(self, axis_name, ticks):
         if axis_name == "x":
@@ -1,5 +1,6 @@
-"""This subpackage contains the Dataset class and the root2data functions."""
+"""This subpackage contains the Dataset class and the root2data and uproot2data functions."""
 from dataset import Dataset
 from root2data import root2data
+from uproot2data import uproot2data
 
-__all__ = ["Dataset", "root2data"]
+__all__ = ["Dataset", "root2data", "uproot2data"]
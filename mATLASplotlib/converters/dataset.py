@@ -1,10 +1,25 @@
 """ This module provides the ``Dataset`` class."""
 import numpy as np
 from root2data import root2data
+from uproot2data import uproot2data
 
 
 class Dataset(object):
-    """Container for plottable datasets."""
+    """Container for plottable datasets.
+
+    Derived attributes, such as ``x_points``, ``y_bin_edges`` or ``band_edges_x``, are constructed on first access and then cached.
+    These are read-only arrays, so they must be copied before being modified.
+    """
+
+    #: Derived attributes available for each dimension, accessed as eg. ``x_points`` or ``y_bin_edges``
+    dimension_attributes = ["points", "error_pairs", "points_error_symmetrised", "errors_symmetrised",
+                            "all_bin_edges", "bin_edges", "bin_widths", "bin_low_edges", "bin_high_edges"]
+
+    #: Derived attributes available when both x and y dimensions are present
+    xy_attributes = ["x_at_y_bin_edges", "y_at_x_bin_edges", "band_edges_x", "band_edges_y_low", "band_edges_y_high"]
+
+    #: Converters used to interpret single objects that are not datasets, tried in order
+    converters = [root2data, uproot2data]
 
     def __init__(self, *args, **kwargs):
         """Constructor - specify values and error pair separately for each dimension.
@@ -17,7 +32,7 @@ class Dataset(object):
             * z values at each (x, y) point : __init__([1, 2], [3, 4], [3, 4, 6, 8])
 
         :Positional Arguments:
-            * **args**: (*ROOT.TObject*, *iterable*, *numpy array*) -- plottable information which is used to build a ``Dataset``
+            * **args**: (*ROOT.TObject*, *uproot object*, *iterable*, *numpy array*) -- plottable information which is used to build a ``Dataset``
 
         :Keyword Arguments:
             * **x_values**: (*iterable*) -- list of points along the x-axis
@@ -26,17 +41,25 @@ class Dataset(object):
             * **y_error_pairs**: (*iterable*) -- list of error pairs along the y-axis
             * **z_values**: (*iterable*) -- list of points along the z-axis
             * **z_error_pairs**: (*iterable*) -- list of error pairs along the z-axis
+            * **remove_zeros**: (*bool*) -- remove points for which the y-value is 0, which needs one-dimensional x, y data (default False)
+            * **n_samples**: (*int*) -- (maximum) number of points at which to sample ROOT functions (default 1000)
+            * **adaptive_sampling**: (*bool*) -- concentrate ROOT function samples in regions of high curvature (default False)
 
         :raises AssertionError: arguments are not correctly sized
-        :raises ValueError: arguments cannot be interpreted
+        :raises ValueError: arguments cannot be interpreted or zeros cannot be removed from them
         """
         self._data = {}
+        self._cache = {}
         self.nPoints = 0
+        remove_zeros = kwargs.get("remove_zeros", False)
 
         # Assume that an existing dataset or a ROOT object has been passed
         if len(args) == 1:
-            if root2data.valid_input(args[0]):
-                self.__from_ROOT(args[0], **kwargs)
+            converter = next((_converter for _converter in self.converters if _converter.valid_input(args[0])), None)
+            if converter is not None:
+                self.__from_converter(converter, args[0], **kwargs)
+                # Some converters remove zeros themselves
+                remove_zeros = remove_zeros and "remove_zeros" not in converter.conversion_arguments
             else:
                 self.__from_dataset(args[0])
 
@@ -64,12 +87,37 @@ class Dataset(object):
         else:
             self.__from_keywords(**kwargs)
 
-        # Add metainformation and validate
-        if "x" in self.get_dimensions() and "y" in self.get_dimensions():
-            self.__add_xy_dimensions()
+        # Validate
         if not self.get_dimensions():
             raise ValueError("Attempt to initialise plottable {0} without providing data!".format(type(self)))
 
+        # Apply requested filtering
+        if remove_zeros:
+            self.remove_zeros()
+
+    def __getattr__(self, name):
+        """Construct derived attributes on first access and cache them.
+
+        :param name: name of the derived attribute
+        :type name: str
+        :return: derived attribute
+        :rtype: np.array
+        :raises AttributeError: no such attribute exists for this dataset
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._cache:
+            attribute = self.__construct_attribute(name)
+            # Cached attributes are shared between callers and some are views of the underlying data, so should not be modified
+            attribute.flags.writeable = False
+            self._cache[name] = attribute
+        return self._cache[name]
+
+    def invalidate_cache(self):
+        """Discard all cached derived attributes so that they are reconstructed on next access.
+        Called automatically whenever the underlying data changes."""
+        self._cache = {}
+
     def construct_2D_bin_list(self, axes="xy"):
         """Construct full set of bins when treating x and y as two sides of a 2D plot.
 
@@ -83,6 +131,56 @@ class Dataset(object):
             raise ValueError("Attempted to construct 2D bin list for {0} axes. Only 'xy' is currently supported.".format(axes))
         return [bin_centre.ravel() for bin_centre in bin_centres]
 
+    def apply_mask(self, mask):
+        """Keep only the points selected by a boolean mask. The mask is applied to every dimension at once.
+
+        :param mask: one boolean per point, indicating whether it should be kept
+        :type mask: iterable(bool)
+        :raises ValueError: mask has the wrong size or the dimensions of this dataset do not have one entry per point
+        """
+        if len(set(data.shape[1] for data in self._data.values())) != 1:
+            raise ValueError("Masks can only be applied when every dimension has one entry per point")
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (self.nPoints,):
+            raise ValueError("Mask of size {0} cannot be applied to {1} points".format(mask.size, self.nPoints))
+        for dimension in self._data:
+            self._data[dimension] = self._data[dimension][:, mask]
+        self.nPoints = int(np.count_nonzero(mask))
+        self.invalidate_cache()
+
+    def remove_zeros(self, dimension="y"):
+        """Remove points with a value of 0 along the chosen dimension of a one-dimensional x, y dataset.
+
+        :param dimension: which dimension to check for zeros
+        :type dimension: str
+        :raises ValueError: this dataset does not have exactly one x and one y value per point
+        """
+        if self.get_dimensions() != ["x", "y"] or self._data["x"].shape != self._data["y"].shape:
+            raise ValueError("Zeros can only be removed from datasets with one x and one y value per point, not from {0} dimensions".format(self.get_dimensions()))
+        self.apply_mask(self._data[dimension][0] != 0)
+
+    def remove_non_finite(self):
+        """Remove points with a NaN or infinite value or error along any dimension."""
+        self.apply_mask(np.all([np.isfinite(data).all(axis=0) for data in self._data.values()], axis=0))
+
+    def restrict_range(self, dimension, minimum=None, maximum=None):
+        """Remove points with values outside the chosen range along one dimension.
+
+        :param dimension: which dimension to apply the range to
+        :type dimension: str
+        :param minimum: smallest value to keep (no lower limit if None)
+        :type minimum: float
+        :param maximum: largest value to keep (no upper limit if None)
+        :type maximum: float
+        """
+        values = self._data[dimension][0]
+        mask = np.ones(values.shape, dtype=bool)
+        if minimum is not None:
+            mask &= values >= minimum
+        if maximum is not None:
+            mask &= values <= maximum
+        self.apply_mask(mask)
+
     def get_dimensions(self):
         """Get a list of dimension names.
 
@@ -101,21 +199,20 @@ class Dataset(object):
         """
         if not isinstance(input_dataset, Dataset):
             raise AssertionError("Failed to interpret argument as an existing dataset")
-        if hasattr(input_dataset, "x_points"):
-            self.__add_dimension("x", input_dataset.x_points, input_dataset.x_error_pairs)
-        if hasattr(input_dataset, "y_points"):
-            self.__add_dimension("y", input_dataset.y_points, input_dataset.y_error_pairs)
-        if hasattr(input_dataset, "z_points"):
-            self.__add_dimension("z", input_dataset.z_points, input_dataset.z_error_pairs)
+        for dimension in input_dataset.get_dimensions():
+            values, errors_low, errors_high = input_dataset._data[dimension]
+            self.__add_dimension(dimension, values, np.column_stack((errors_low, errors_high)))
         self.nPoints = input_dataset.nPoints
 
-    def __from_ROOT(self, input_object, **kwargs):
-        """Construct from an existing ROOT object.
+    def __from_converter(self, converter, input_object, **kwargs):
+        """Construct from an object that can be interpreted by one of the converters.
 
-        :param input_object: ROOT object
-        :type input_object: ROOT.TObject
+        :param converter: converter class, eg. root2data
+        :type converter: type
+        :param input_object: object to convert, eg. a ROOT.TObject
+        :type input_object: object
         """
-        data = root2data(input_object, remove_zeros=kwargs.pop("remove_zeros", False))
+        data = converter(input_object, **dict((key, kwargs[key]) for key in converter.conversion_arguments if key in kwargs))
         for dimension in ["x", "y", "z"]:
             if hasattr(data, "{0}_values".format(dimension)) and getattr(data, "{0}_values".format(dimension)) is not None:
                 self.__add_dimension(dimension, getattr(data, "{0}_values".format(dimension)), getattr(data, "{0}_error_pairs".format(dimension)))
@@ -135,7 +232,7 @@ class Dataset(object):
             raise AssertionError("Failed to interpret arguments as 'x' and 'y' points since they differ in size")
         self.__add_dimension("x", x, None)
         self.__add_dimension("y", y, None)
-        self.nPoints = len(self._data["x"])
+        self.nPoints = self._data["x"].shape[1]
 
     def __from_xyz_values(self, x, y, z):
         """Construct from x, y, z values.
@@ -154,7 +251,7 @@ class Dataset(object):
         self.__add_dimension("x", x, None)
         self.__add_dimension("y", y, None)
         self.__add_dimension("z", z, None)
-        self.nPoints = len(self._data["z"])
+        self.nPoints = self._data["z"].shape[1]
 
     def __from_xy_values_errors(self, x, x_err, y, y_err):
         """Construct from x, y values with errors.
@@ -174,7 +271,7 @@ class Dataset(object):
             raise AssertionError("Failed to interpret arguments as 'x' and 'y' points with errors since they differ in size")
         self.__add_dimension("x", x, x_err)
         self.__add_dimension("y", y, y_err)
-        self.nPoints = len(self._data["x"])
+        self.nPoints = self._data["x"].shape[1]
 
     def __from_xyz_values_errors(self, x, x_err, y, y_err, z, z_err):
         """Construct from x, y, z values with errors.
@@ -199,7 +296,7 @@ class Dataset(object):
         self.__add_dimension("x", x, x_err)
         self.__add_dimension("y", y, y_err)
         self.__add_dimension("z", z, z_err)
-        self.nPoints = len(self._data["z"])
+        self.nPoints = self._data["z"].shape[1]
 
     def __from_keywords(self, **kwargs):
         """Construct an array of points with an error pair in each direction.
@@ -214,16 +311,18 @@ class Dataset(object):
         """
         if "x_values" in kwargs:
             self.__add_dimension("x", kwargs.pop("x_values"), kwargs.get("x_error_pairs", None))
-            self.nPoints = len(self._data["x"])
+            self.nPoints = self._data["x"].shape[1]
         if "y_values" in kwargs:
             self.__add_dimension("y", kwargs.pop("y_values"), kwargs.get("y_error_pairs", None))
         if "z_values" in kwargs:
             self.__add_dimension("z", kwargs.pop("z_values"), kwargs.get("z_error_pairs", None))
-            self.nPoints = len(self._data["z"])
+            self.nPoints = self._data["z"].shape[1]
 
     def __add_dimension(self, dimension, values, error_pairs):
         """Add a new dimension with appropriate methods.
 
+        The dimension is stored as a contiguous float64 array with one row each for the values, the low errors and the high errors.
+
         :param dimension: which axis dimension to add
         :type dimension: str
         :param values: values along this dimension
@@ -231,140 +330,127 @@ class Dataset(object):
         :param error_pairs: pairs of errors for each point
         :type error_pairs: list[tuple]
         """
+        values = np.asarray(values, dtype=np.float64).ravel()
         # Use zeros if no errors provided
-        if error_pairs is None:
-            error_pairs = [(0, 0)] * len(values)
-        try:
-            # If errors are paired, check that each pair has two elements
-            for error_pair in error_pairs:
-                if len(error_pair) != 2:
-                    raise ValueError("Error pairs must be of size 2!")
-        except TypeError:
-            # Otherwise construct symmetric error pairs
-            error_pairs = [(e, e) for e in error_pairs]
-        # Check that the dimensions match
-        if len(values) != len(error_pairs):
-            raise ValueError("Number of error pairs must equal number of values!")
+        dimension_data = np.zeros((3, len(values)), dtype=np.float64)
+        dimension_data[0] = values
+        if error_pairs is not None:
+            errors = np.asarray(error_pairs, dtype=np.float64)
+            if errors.ndim == 1:
+                # Construct symmetric error pairs
+                errors = np.column_stack((errors, errors))
+            elif errors.ndim != 2 or errors.shape[1] != 2:
+                # If errors are paired, check that each pair has two elements
+                raise ValueError("Error pairs must be of size 2!")
+            # Check that the dimensions match
+            if len(values) != len(errors):
+                raise ValueError("Number of error pairs must equal number of values!")
+            dimension_data[1:] = errors.T
         # Register this dimension
-        self._data[dimension] = np.array([[value, error_pair[0], error_pair[1]] for value, error_pair in zip(values, error_pairs)])
-        # Add appropriate attributes
-        setattr(self, "{0}_points".format(dimension), self.__get_points(dimension))
-        setattr(self, "{0}_error_pairs".format(dimension), self.__get_error_pairs(dimension))
-        setattr(self, "{0}_points_error_symmetrised".format(dimension), self.__get_points_error_symmetrised(dimension))
-        setattr(self, "{0}_errors_symmetrised".format(dimension), self.__get_errors_symmetrised(dimension))
-        setattr(self, "{0}_all_bin_edges".format(dimension), self.__get_all_bin_edges(dimension))
-        setattr(self, "{0}_bin_edges".format(dimension), self.__get_bin_edges(dimension))
-        setattr(self, "{0}_bin_widths".format(dimension), self.__get_bin_widths(dimension))
-        setattr(self, "{0}_bin_low_edges".format(dimension), self.__get_bin_low_edges(dimension))
-        setattr(self, "{0}_bin_high_edges".format(dimension), self.__get_bin_high_edges(dimension))
-
-    def __add_xy_dimensions(self):
-        """Add xy-appropriate methods."""
-        setattr(self, "x_at_y_bin_edges", self.__get_x_at_y_bin_edges())
-        setattr(self, "y_at_x_bin_edges", self.__get_y_at_x_bin_edges())
-        setattr(self, "band_edges_x", self.__get_band_edges_x())
-        setattr(self, "band_edges_y_low", self.__get_band_edges_y_low())
-        setattr(self, "band_edges_y_high", self.__get_band_edges_y_high())
+        self._data[dimension] = dimension_data
+        self.invalidate_cache()
+
+    def __construct_attribute(self, name):
+        """Construct a derived attribute.
+
+        :param name: name of the derived attribute
+        :type name: str
+        :return: derived attribute
+        :rtype: np.array
+        :raises AttributeError: no such attribute exists for this dataset
+        """
+        dimension, _, quantity = name.partition("_")
+        if dimension in self._data and quantity in self.dimension_attributes:
+            builders = {"points": self.__get_points,
+                        "error_pairs": self.__get_error_pairs,
+                        "points_error_symmetrised": self.__get_points_error_symmetrised,
+                        "errors_symmetrised": self.__get_errors_symmetrised,
+                        "all_bin_edges": self.__get_all_bin_edges,
+                        "bin_edges": self.__get_bin_edges,
+                        "bin_widths": self.__get_bin_widths,
+                        "bin_low_edges": self.__get_bin_low_edges,
+                        "bin_high_edges": self.__get_bin_high_edges}
+            return builders[quantity](dimension)
+        if name in self.xy_attributes and "x" in self._data and "y" in self._data:
+            builders = {"x_at_y_bin_edges": self.__get_x_at_y_bin_edges,
+                        "y_at_x_bin_edges": self.__get_y_at_x_bin_edges,
+                        "band_edges_x": self.__get_band_edges_x,
+                        "band_edges_y_low": self.__get_band_edges_y_low,
+                        "band_edges_y_high": self.__get_band_edges_y_high}
+            return builders[name]()
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, name))
 
     def __get_points(self, dimension):
-        """Return array of x/y/z points, constructing if necessary."""
-        attr_name = "_{0}_points".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([point[0] for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z points."""
+        return self._data[dimension][0]
 
     def __get_error_pairs(self, dimension):
-        """Return array of x/y/z points, constructing if necessary."""
-        attr_name = "_{0}_error_pairs".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([[point[1], point[2]] for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z error pairs."""
+        return self._data[dimension][1:].T
 
     def __get_points_error_symmetrised(self, dimension):
-        """Return array of x/y/z points, constructing if necessary."""
-        attr_name = "_{0}_points_error_symmetrised".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([point[0] + (point[2] - point[1]) / 2.0 for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z points recentred to have symmetric errors."""
+        values, errors_low, errors_high = self._data[dimension]
+        return values + (errors_high - errors_low) / 2.0
 
     def __get_errors_symmetrised(self, dimension):
-        """Return array of x/y/z points, constructing if necessary."""
-        attr_name = "_{0}_errors_symmetrised".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([(point[1] + point[2]) / 2.0 for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z symmetrised errors."""
+        _, errors_low, errors_high = self._data[dimension]
+        return (errors_low + errors_high) / 2.0
 
     def __get_all_bin_edges(self, dimension):
-        """Return array of all x/y/z bin edges, constructing if necessary."""
-        attr_name = "_{0}_all_bin_edges".format(dimension)
-        if not hasattr(self, attr_name):
-            low_edges, high_edges = self.__get_bin_low_edges(dimension), self.__get_bin_high_edges(dimension)
-            value = np.array(sum([[low, high] for low, high in zip(low_edges, high_edges)], []))
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of all x/y/z bin edges."""
+        low_edges, high_edges = getattr(self, "{0}_bin_low_edges".format(dimension)), getattr(self, "{0}_bin_high_edges".format(dimension))
+        return _interleave(low_edges, high_edges)
 
     def __get_bin_edges(self, dimension):
-        """Return array of x/y/z bin edges without duplicates, constructing if necessary."""
-        attr_name = "_{0}_bin_edges".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.unique(getattr(self, "_{0}_all_bin_edges".format(dimension)))
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z bin edges without duplicates."""
+        return np.unique(getattr(self, "{0}_all_bin_edges".format(dimension)))
 
     def __get_bin_widths(self, dimension):
-        """Return array of x/y/z bin widths, constructing if necessary."""
-        attr_name = "_{0}_bin_widths".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([point[1] + point[2] for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z bin widths."""
+        _, errors_low, errors_high = self._data[dimension]
+        return errors_low + errors_high
 
     def __get_bin_low_edges(self, dimension):
-        """Return array of x/y/z bin low edges, constructing if necessary."""
-        attr_name = "_{0}_bin_low_edges".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([point[0] - point[1] for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z bin low edges."""
+        values, errors_low, _ = self._data[dimension]
+        return values - errors_low
 
     def __get_bin_high_edges(self, dimension):
-        """Return array of x/y/z bin high edges, constructing if necessary."""
-        attr_name = "_{0}_bin_high_edges".format(dimension)
-        if not hasattr(self, attr_name):
-            value = np.array([point[0] + point[2] for point in self._data[dimension]])
-            setattr(self, attr_name, value)
-        return getattr(self, attr_name)
+        """Return array of x/y/z bin high edges."""
+        values, _, errors_high = self._data[dimension]
+        return values + errors_high
 
     def __get_x_at_y_bin_edges(self):
-        """Return array of x at the bin edges of y bins, constructing if necessary."""
-        if not hasattr(self, "_x_at_y_bin_edges"):
-            setattr(self, "_x_at_y_bin_edges", np.array(sum([[x_point, x_point] for x_point in getattr(self, "x_points")], [])))
-        return getattr(self, "_x_at_y_bin_edges")
+        """Return array of x at the bin edges of y bins."""
+        return np.repeat(self.x_points, 2)
 
     def __get_y_at_x_bin_edges(self):
-        """Return array of y at the bin edges of x bins, constructing if necessary."""
-        if not hasattr(self, "_y_at_x_bin_edges"):
-            setattr(self, "_y_at_x_bin_edges", np.array(sum([[y_point, y_point] for y_point in getattr(self, "y_points")], [])))
-        return getattr(self, "_y_at_x_bin_edges")
+        """Return array of y at the bin edges of x bins."""
+        return np.repeat(self.y_points, 2)
 
     def __get_band_edges_x(self):
-        """Return array of x edges for fillable band, constructing if necessary."""
-        if not hasattr(self, "_band_edges_x"):
-            setattr(self, "_band_edges_x", np.array(sum([[point[0] - point[1], point[0] + point[2]] for point in self._data["x"]], [])))
-        return getattr(self, "_band_edges_x")
+        """Return array of x edges for fillable band."""
+        return _interleave(self.x_bin_low_edges, self.x_bin_high_edges)
 
     def __get_band_edges_y_low(self):
-        """Return array of y minima for fillable band, constructing if necessary."""
-        if not hasattr(self, "_band_edges_y_low"):
-            setattr(self, "_band_edges_y_low", np.array(sum([[point[0] - point[1], point[0] - point[1]] for point in self._data["y"]], [])))
-        return getattr(self, "_band_edges_y_low")
+        """Return array of y minima for fillable band."""
+        return np.repeat(self.y_bin_low_edges, 2)
 
     def __get_band_edges_y_high(self):
-        """Return array of y maxima for fillable band, constructing if necessary."""
-        if not hasattr(self, "_band_edges_y_high"):
-            setattr(self, "_band_edges_y_high", np.array(sum([[point[0] + point[2], point[0] + point[2]] for point in self._data["y"]], [])))
-        return getattr(self, "_band_edges_y_high")
+        """Return array of y maxima for fillable band."""
+        return np.repeat(self.y_bin_high_edges, 2)
+
+
+def _interleave(first, second):
+    """Interleave two equal-length arrays in linear time.
+
+    :param first: array providing the even-indexed elements
+    :type first: np.array
+    :param second: array providing the odd-indexed elements
+    :type second: np.array
+    :return: [first[0], second[0], first[1], second[1], ...]
+    :rtype: np.array
+    """
+    return np.column_stack((first, second)).ravel()
@@ -1,22 +1,41 @@
 """ This module provides the ``root2data`` class."""
+import sys
 import numpy as np
-import ROOT
 
 # pylint: disable=no-member
 # ROOT members are incorrectly flagged as not belonging to the package
+# PyROOT is slow to import so it is only imported once a ROOT object needs to be converted
+
+# Histogram classes which override GetBinContent, so must always be read one bin at a time
+_per_bin_classes = ["TProfile", "TProfile2D", "TProfile3D", "TH1K"]
 
 
 class root2data(object):
     """Interpreter for ROOT objects."""
 
-    def __init__(self, root_object, remove_zeros=False):
+    #: Keyword arguments understood by this converter
+    conversion_arguments = ["remove_zeros", "n_samples", "adaptive_sampling"]
+
+    def __init__(self, root_object, remove_zeros=False, copy=False, n_samples=1000, adaptive_sampling=False):
         """Extract x/y/z information from a ROOT object.
 
+        Where possible the extracted arrays are views onto the memory owned by the ROOT object.
+
         :param root_object: ROOT input to interpret
         :type root_object: ROOT.TObject
         :param remove_zeros: whether to remove points with a value of 0
         :type remove_zeros: bool
+        :param copy: whether to copy the ROOT buffers so that the extracted arrays can outlive the ROOT object
+        :type copy: bool
+        :param n_samples: (maximum) number of points at which to sample functions
+        :type n_samples: int
+        :param adaptive_sampling: whether to concentrate function samples in regions of high curvature
+        :type adaptive_sampling: bool
         """
+        import ROOT
+        self.copy = copy
+        self.n_samples = n_samples
+        self.adaptive_sampling = adaptive_sampling
         self.x_values, self.x_error_pairs = None, None
         self.y_values, self.y_error_pairs = None, None
         self.z_values, self.z_error_pairs = None, None
@@ -48,56 +67,77 @@ class root2data(object):
     def valid_input(test_object):
         """Check that the input object is a valid ROOT TObject.
 
+        This does not import ROOT: if it has not already been imported then the input cannot be a ROOT object.
+
         :param test_object: input object to invesigate
         :type test_object: object
         :return: whether the input object is a ROOT TObject
         :rtype: bool
         """
-        return isinstance(test_object, ROOT.TObject)
+        ROOT = sys.modules.get("ROOT", None)
+        return ROOT is not None and isinstance(test_object, ROOT.TObject)
 
     def construct_from_TF1(self, input_TF1):
         """Read TF1 into x, y dimensions.
 
+        The function is sampled at up to ``n_samples`` points. These are either spaced uniformly across its range or,
+        if ``adaptive_sampling`` is set, concentrated where the function curves most strongly.
+
         :param input_TF1: input TF1
         :type input_TF1: ROOT.TF1
         """
-        x_min, x_max = ROOT.Double(), ROOT.Double()
-        input_TF1.GetRange(x_min, x_max)
-        self.x_values = np.linspace(x_min, x_max, num=1000, endpoint=True)
-        self.x_error_pairs = [[0, 0] for _ in range(len(self.x_values))]
-        self.y_values = [input_TF1.Eval(x) for x in self.x_values]
-        self.y_error_pairs = [[0, 0] for _ in range(len(self.y_values))]
+        x_min, x_max = input_TF1.GetXmin(), input_TF1.GetXmax()
+        if self.adaptive_sampling:
+            self.x_values, self.y_values = _sample_adaptively(lambda x: _evaluate_TF1(input_TF1, x), x_min, x_max, self.n_samples)
+        else:
+            self.x_values = np.linspace(x_min, x_max, num=self.n_samples, endpoint=True)
+            self.y_values = _evaluate_TF1(input_TF1, self.x_values)
+        self.x_error_pairs = np.zeros((len(self.x_values), 2))
+        self.y_error_pairs = np.zeros((len(self.y_values), 2))
         self.nPoints = len(self.x_values)
 
     def construct_from_TH1(self, input_TH1):
         """Read TH1 into x, y dimensions.
 
+        Bin contents, errors and edges are read from the underlying ROOT buffers in bulk.
+        Per-bin access is only used when the histogram has asymmetric (eg. Poisson) errors configured.
+
         :param input_TH1: input TH1
         :type input_TH1: ROOT.TH1
         """
-        self.x_values = [input_TH1.GetXaxis().GetBinCenter(_bin) for _bin in range(1, input_TH1.GetNbinsX() + 1)]
-        self.x_error_pairs = [[0.5 * input_TH1.GetXaxis().GetBinWidth(_bin)] * 2 for _bin in range(1, input_TH1.GetNbinsX() + 1)]
-        self.y_values = [input_TH1.GetBinContent(_bin) for _bin in range(1, input_TH1.GetNbinsX() + 1)]
-        self.y_error_pairs = [(input_TH1.GetBinErrorLow(_bin), input_TH1.GetBinErrorUp(_bin)) for _bin in range(1, input_TH1.GetNbinsX() + 1)]
+        self.x_values, self.x_error_pairs = _axis_arrays(input_TH1.GetXaxis())
+        if _supports_bulk_access(input_TH1):
+            contents, errors = _content_error_arrays(input_TH1, self.copy)
+            self.y_values = contents[1:-1]
+            self.y_error_pairs = np.column_stack((errors[1:-1], errors[1:-1]))
+        else:
+            self.y_values = [input_TH1.GetBinContent(_bin) for _bin in range(1, input_TH1.GetNbinsX() + 1)]
+            self.y_error_pairs = [(input_TH1.GetBinErrorLow(_bin), input_TH1.GetBinErrorUp(_bin)) for _bin in range(1, input_TH1.GetNbinsX() + 1)]
         self.nPoints = len(self.x_values)
 
     def construct_from_TH2(self, input_TH2):
         """Read TH2 into x, y, z dimensions.
 
+        Bin contents, errors and edges are read from the underlying ROOT buffers in bulk.
+        Per-bin access is only used when the histogram has asymmetric (eg. Poisson) errors configured.
+
         :param input_TH2: input TH2
         :type input_TH2: ROOT.TH2
         """
-        self.x_values = [input_TH2.GetXaxis().GetBinCenter(_bin) for _bin in range(1, input_TH2.GetNbinsX() + 1)]
-        self.x_error_pairs = [[0.5 * input_TH2.GetXaxis().GetBinWidth(_bin)] * 2 for _bin in range(1, input_TH2.GetNbinsX() + 1)]
-        self.y_values = [input_TH2.GetYaxis().GetBinCenter(_bin) for _bin in range(1, input_TH2.GetNbinsY() + 1)]
-        self.y_error_pairs = [[0.5 * input_TH2.GetYaxis().GetBinWidth(_bin)] * 2 for _bin in range(1, input_TH2.GetNbinsY() + 1)]
-        self.z_values, self.z_error_pairs = [], []
-        x_bin_edges = [input_TH2.GetXaxis().GetBinLowEdge(_bin) for _bin in range(1, input_TH2.GetNbinsX() + 2)]
-        y_bin_edges = [input_TH2.GetYaxis().GetBinLowEdge(_bin) for _bin in range(1, input_TH2.GetNbinsY() + 2)]
-        ix_array, iy_array = np.meshgrid(range(1, len(x_bin_edges)), range(1, len(y_bin_edges)), indexing='xy')
-        for ix, iy in zip(ix_array.ravel(), iy_array.ravel()):
-            self.z_values.append(input_TH2.GetBinContent(ix, iy))
-            self.z_error_pairs.append((input_TH2.GetBinErrorLow(ix, iy), input_TH2.GetBinErrorUp(ix, iy)))
+        self.x_values, self.x_error_pairs = _axis_arrays(input_TH2.GetXaxis())
+        self.y_values, self.y_error_pairs = _axis_arrays(input_TH2.GetYaxis())
+        n_bins_x, n_bins_y = input_TH2.GetNbinsX(), input_TH2.GetNbinsY()
+        if _supports_bulk_access(input_TH2):
+            # ROOT stores cells with x varying fastest, including underflow and overflow bins along each axis
+            contents, errors = [array.reshape(n_bins_y + 2, n_bins_x + 2)[1:-1, 1:-1].ravel() for array in _content_error_arrays(input_TH2, self.copy)]
+            self.z_values = contents
+            self.z_error_pairs = np.column_stack((errors, errors))
+        else:
+            self.z_values, self.z_error_pairs = [], []
+            ix_array, iy_array = np.meshgrid(range(1, n_bins_x + 1), range(1, n_bins_y + 1), indexing='xy')
+            for ix, iy in zip(ix_array.ravel(), iy_array.ravel()):
+                self.z_values.append(input_TH2.GetBinContent(ix, iy))
+                self.z_error_pairs.append((input_TH2.GetBinErrorLow(ix, iy), input_TH2.GetBinErrorUp(ix, iy)))
         self.nPoints = len(self.z_values)
 
     def construct_from_TGraph(self, input_TGraph):
@@ -106,14 +146,12 @@ class root2data(object):
         :param input_TGraph: input TGraph
         :type input_TGraph: ROOT.TGraph
         """
-        x, y = input_TGraph.GetX(), input_TGraph.GetY()
-        self.x_values, self.x_error_pairs, self.y_values, self.y_error_pairs = [], [], [], []
-        for ii in range(input_TGraph.GetN()):
-            self.x_values.append(x[ii])
-            self.x_error_pairs.append([0, 0])
-            self.y_values.append(y[ii])
-            self.y_error_pairs.append([0, 0])
-        self.nPoints = len(self.x_values)
+        n_points = input_TGraph.GetN()
+        self.x_values = _as_array(input_TGraph.GetX(), n_points, np.float64, self.copy)
+        self.x_error_pairs = np.zeros((n_points, 2))
+        self.y_values = _as_array(input_TGraph.GetY(), n_points, np.float64, self.copy)
+        self.y_error_pairs = np.zeros((n_points, 2))
+        self.nPoints = n_points
 
     def construct_from_TGraphErrors(self, input_TGraphErrors):
         """Read TGraphErrors into x, y dimensions.
@@ -121,48 +159,206 @@ class root2data(object):
         :param input_TGraphErrors: input TGraphErrors
         :type input_TGraphErrors: ROOT.TGraphErrors
         """
-        x, x_errors = input_TGraphErrors.GetX(), input_TGraphErrors.GetEX()
-        y, y_errors = input_TGraphErrors.GetY(), input_TGraphErrors.GetEY()
-        self.x_values, self.x_error_pairs, self.y_values, self.y_error_pairs = [], [], [], []
-        for ii in range(input_TGraphErrors.GetN()):
-            self.x_values.append(x[ii])
-            self.x_error_pairs.append([x_errors[ii]] * 2)
-            self.y_values.append(y[ii])
-            self.y_error_pairs.append([y_errors[ii]] * 2)
-        self.nPoints = len(self.x_values)
+        n_points = input_TGraphErrors.GetN()
+        x_errors = _as_array(input_TGraphErrors.GetEX(), n_points, np.float64)
+        y_errors = _as_array(input_TGraphErrors.GetEY(), n_points, np.float64)
+        self.x_values = _as_array(input_TGraphErrors.GetX(), n_points, np.float64, self.copy)
+        self.x_error_pairs = np.column_stack((x_errors, x_errors))
+        self.y_values = _as_array(input_TGraphErrors.GetY(), n_points, np.float64, self.copy)
+        self.y_error_pairs = np.column_stack((y_errors, y_errors))
+        self.nPoints = n_points
 
     def construct_from_TGraphAsymmErrors(self, input_TGraphAsymmErrors):
-        """Read TGraphErrors into x, y dimensions.
+        """Read TGraphAsymmErrors into x, y dimensions.
+
+        The x points are recentred such that the x errors are symmetric.
 
         :param input_TGraphAsymmErrors: input TGraphAsymmErrors
         :type input_TGraphAsymmErrors: ROOT.TGraphAsymmErrors
         """
-        x, x_errors_low, x_errors_high = input_TGraphAsymmErrors.GetX(), input_TGraphAsymmErrors.GetEXlow(), input_TGraphAsymmErrors.GetEXhigh()
-        y, y_errors_low, y_errors_high = input_TGraphAsymmErrors.GetY(), input_TGraphAsymmErrors.GetEYlow(), input_TGraphAsymmErrors.GetEYhigh()
-        self.x_values, self.x_error_pairs, self.y_values, self.y_error_pairs = [], [], [], []
-        for ii in range(input_TGraphAsymmErrors.GetN()):
-            self.x_values.append(x[ii] + (x_errors_high[ii] - x_errors_low[ii]) / 2.0)
-            self.x_error_pairs.append([(x_errors_high[ii] + x_errors_low[ii]) / 2.0] * 2)
-            self.y_values.append(y[ii])
-            self.y_error_pairs.append([y_errors_low[ii], y_errors_high[ii]])
-        self.nPoints = len(self.x_values)
+        n_points = input_TGraphAsymmErrors.GetN()
+        x = _as_array(input_TGraphAsymmErrors.GetX(), n_points, np.float64)
+        x_errors_low = _as_array(input_TGraphAsymmErrors.GetEXlow(), n_points, np.float64)
+        x_errors_high = _as_array(input_TGraphAsymmErrors.GetEXhigh(), n_points, np.float64)
+        y_errors_low = _as_array(input_TGraphAsymmErrors.GetEYlow(), n_points, np.float64)
+        y_errors_high = _as_array(input_TGraphAsymmErrors.GetEYhigh(), n_points, np.float64)
+        x_errors = (x_errors_high + x_errors_low) / 2.0
+        self.x_values = x + (x_errors_high - x_errors_low) / 2.0
+        self.x_error_pairs = np.column_stack((x_errors, x_errors))
+        self.y_values = _as_array(input_TGraphAsymmErrors.GetY(), n_points, np.float64, self.copy)
+        self.y_error_pairs = np.column_stack((y_errors_low, y_errors_high))
+        self.nPoints = n_points
 
     def do_zero_removal(self):
         """Remove points with zero y-value."""
-        def filter_by_list(input_list, filter_list):
-            """Filter items according to a boolean filter.
-
-            :param input_list: list to filter
-            :type input_list: list
-            :param filter_list: filter to apply. Booleans indicate whether each element should be retained.
-            :type filter_list: list(bool)
-            :return: filtered list (subset of the input list)
-            :rtype: list
-            """
-            return [val for idx, val in zip(filter_list, input_list) if idx]
-        indices_to_keep = [_y != 0 for _y in self.y_values]
-        self.x_values = filter_by_list(self.x_values, indices_to_keep)
-        self.x_error_pairs = filter_by_list(self.x_error_pairs, indices_to_keep)
-        self.y_values = filter_by_list(self.y_values, indices_to_keep)
-        self.y_error_pairs = filter_by_list(self.y_error_pairs, indices_to_keep)
+        indices_to_keep = np.asarray(self.y_values) != 0
+        self.x_values = np.asarray(self.x_values)[indices_to_keep]
+        self.x_error_pairs = np.asarray(self.x_error_pairs)[indices_to_keep]
+        self.y_values = np.asarray(self.y_values)[indices_to_keep]
+        self.y_error_pairs = np.asarray(self.y_error_pairs)[indices_to_keep]
         self.nPoints = len(self.x_values)
+
+
+def _as_array(buffer, size, dtype, copy=False):
+    """Wrap a ROOT buffer of known size as a NumPy array without copying, unless a copy is requested.
+
+    :param buffer: buffer returned by ROOT, eg. from GetArray()
+    :type buffer: ROOT buffer
+    :param size: number of elements in the buffer
+    :type size: int
+    :param dtype: type of the buffer elements
+    :type dtype: np.dtype
+    :param copy: whether to copy the buffer contents
+    :type copy: bool
+    :return: view onto (or copy of) the buffer
+    :rtype: np.array
+    """
+    if size == 0:
+        return np.zeros(0, dtype=dtype)
+    # PyROOT buffers do not know their own length until told
+    if hasattr(buffer, "SetSize"):
+        buffer.SetSize(size)
+    elif hasattr(buffer, "reshape"):
+        buffer.reshape((size,))
+    view = np.frombuffer(buffer, dtype=dtype, count=size)
+    return view.copy() if copy else view
+
+
+def _evaluate_TF1(input_TF1, x_values):
+    """Evaluate a TF1 at each of an array of points, using a single call where PyROOT supports it.
+
+    :param input_TF1: function to evaluate
+    :type input_TF1: ROOT.TF1
+    :param x_values: points at which to evaluate the function
+    :type x_values: np.array
+    :return: function values
+    :rtype: np.array
+    """
+    x_values = np.ascontiguousarray(x_values, dtype=np.float64)
+    try:
+        # Newer PyROOT versions evaluate an (n_points, n_dimensions) array in one call
+        y_values = input_TF1.EvalPar(x_values.reshape(-1, 1))
+        if np.ndim(y_values) == 1 and len(y_values) == len(x_values):
+            return np.asarray(y_values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+    return np.array([input_TF1.Eval(x) for x in x_values], dtype=np.float64)
+
+
+def _sample_adaptively(function, x_min, x_max, n_samples, tolerance=1e-3):
+    """Sample a function with points concentrated where it is poorly described by straight line segments.
+
+    Starting from a coarse uniform grid, each interval whose midpoint deviates from the line joining its end-points
+    by more than ``tolerance`` times the range of the function is bisected. This is repeated until no such intervals
+    remain or until ``n_samples`` points have been used, in which case the intervals with the largest deviation are
+    bisected first.
+
+    :param function: vectorised function to sample
+    :type function: callable
+    :param x_min: lower end of the sampling range
+    :type x_min: float
+    :param x_max: upper end of the sampling range
+    :type x_max: float
+    :param n_samples: maximum number of samples
+    :type n_samples: int
+    :param tolerance: allowed deviation from linear interpolation, as a fraction of the range of the function
+    :type tolerance: float
+    :return: sampled x and y values
+    :rtype: (np.array, np.array)
+    """
+    x_values = np.linspace(x_min, x_max, num=min(n_samples, max(3, n_samples // 16)), endpoint=True)
+    y_values = function(x_values)
+    x_midpoints = 0.5 * (x_values[:-1] + x_values[1:])
+    y_midpoints = function(x_midpoints)
+    while len(x_values) < n_samples:
+        deviations = np.abs(y_midpoints - 0.5 * (y_values[:-1] + y_values[1:]))
+        y_range = np.nanmax(y_values) - np.nanmin(y_values)
+        to_refine = np.flatnonzero(deviations > tolerance * (y_range if y_range > 0 else 1.0))
+        if to_refine.size == 0:
+            break
+        to_refine = np.sort(to_refine[np.argsort(deviations[to_refine])[::-1][:n_samples - len(x_values)]])
+        # Each bisected interval is replaced by its two halves, which are the only new midpoints that need evaluating
+        x_left = 0.5 * (x_values[to_refine] + x_midpoints[to_refine])
+        x_right = 0.5 * (x_midpoints[to_refine] + x_values[to_refine + 1])
+        x_values = np.insert(x_values, to_refine + 1, x_midpoints[to_refine])
+        y_values = np.insert(y_values, to_refine + 1, y_midpoints[to_refine])
+        if len(x_values) >= n_samples:
+            break
+        y_halves = function(np.concatenate((x_left, x_right)))
+        x_midpoints[to_refine], y_midpoints[to_refine] = x_left, y_halves[:len(to_refine)]
+        x_midpoints = np.insert(x_midpoints, to_refine + 1, x_right)
+        y_midpoints = np.insert(y_midpoints, to_refine + 1, y_halves[len(to_refine):])
+    return x_values, y_values
+
+
+def _axis_arrays(axis):
+    """Get bin centres and half-width error pairs for a ROOT axis.
+
+    :param axis: input axis
+    :type axis: ROOT.TAxis
+    :return: bin centres and error pairs
+    :rtype: (np.array, np.array)
+    """
+    n_bins = axis.GetNbins()
+    if axis.IsVariableBinSize():
+        edges = _as_array(axis.GetXbins().GetArray(), n_bins + 1, np.float64)
+        centres, half_widths = 0.5 * (edges[1:] + edges[:-1]), 0.5 * (edges[1:] - edges[:-1])
+    else:
+        # This mirrors the calculation in TAxis::GetBinCenter and TAxis::GetBinWidth
+        bin_width = (axis.GetXmax() - axis.GetXmin()) / n_bins
+        centres = axis.GetXmin() + (np.arange(n_bins) + 0.5) * bin_width
+        half_widths = np.full(n_bins, 0.5 * bin_width)
+    return centres, np.column_stack((half_widths, half_widths))
+
+
+def _content_dtype(input_histogram):
+    """Get the NumPy type matching the storage of a ROOT histogram.
+
+    :param input_histogram: input histogram
+    :type input_histogram: ROOT.TH1
+    :return: type of the bin contents or None if this is not known
+    :rtype: np.dtype
+    """
+    import ROOT
+    for array_type, dtype in [("TArrayD", np.float64), ("TArrayF", np.float32), ("TArrayI", np.int32), ("TArrayS", np.int16)]:
+        if isinstance(input_histogram, getattr(ROOT, array_type)):
+            return dtype
+    return None
+
+
+def _supports_bulk_access(input_histogram):
+    """Check whether contents and errors can be read directly from the histogram buffers.
+
+    :param input_histogram: input histogram
+    :type input_histogram: ROOT.TH1
+    :return: whether bulk access gives the same result as per-bin access
+    :rtype: bool
+    """
+    import ROOT
+    # The buffers of these classes do not hold the bin contents, eg. profiles store sums of weighted values
+    if any(isinstance(input_histogram, getattr(ROOT, class_name)) for class_name in _per_bin_classes if hasattr(ROOT, class_name)):
+        return False
+    if _content_dtype(input_histogram) is None:
+        return False
+    return input_histogram.GetBinErrorOption() == ROOT.TH1.kNormal
+
+
+def _content_error_arrays(input_histogram, copy=False):
+    """Read contents and symmetric errors for every cell (including underflow and overflow) of a histogram.
+
+    :param input_histogram: input histogram
+    :type input_histogram: ROOT.TH1
+    :param copy: whether to copy the contents rather than returning a view
+    :type copy: bool
+    :return: contents and errors
+    :rtype: (np.array, np.array)
+    """
+    input_histogram.BufferEmpty()
+    n_cells = input_histogram.GetSize()
+    contents = _as_array(input_histogram.GetArray(), n_cells, _content_dtype(input_histogram), copy)
+    # This mirrors the calculation in TH1::GetBinError
+    if input_histogram.GetSumw2N() > 0:
+        errors = np.sqrt(_as_array(input_histogram.GetSumw2().GetArray(), n_cells, np.float64))
+    else:
+        errors = np.sqrt(np.abs(contents, dtype=np.float64))
+    return contents, errors
@@ -0,0 +1,193 @@
+""" This module provides the ``uproot2data`` class."""
+import numpy as np
+
+
+class uproot2data(object):
+    """Interpreter for ROOT objects read from file with ``uproot``, which does not need PyROOT.
+
+    :Example:
+        * ``Dataset(uproot.open("input.root")["histogram_name"])``
+    """
+
+    #: Keyword arguments understood by this converter
+    conversion_arguments = []
+
+    def __init__(self, uproot_object):
+        """Extract x/y/z information from an uproot object.
+
+        :param uproot_object: uproot input to interpret
+        :type uproot_object: uproot.rootio.ROOTObject
+        :raises ValueError: input is not of a supported class
+        """
+        self.x_values, self.x_error_pairs = None, None
+        self.y_values, self.y_error_pairs = None, None
+        self.z_values, self.z_error_pairs = None, None
+        self.nPoints = 0
+        class_name = self.get_class_name(uproot_object)
+        # Initialise TH2 constructor
+        if class_name.startswith("TH2"):
+            self.construct_from_TH2(uproot_object)
+        # Initialise TH1 constructor
+        elif class_name.startswith("TH1"):
+            self.construct_from_TH1(uproot_object)
+        # Initialise TGraphAsymmErrors constructor
+        elif class_name == "TGraphAsymmErrors":
+            self.construct_from_TGraphAsymmErrors(uproot_object)
+        # Initialise TGraphErrors constructor
+        elif class_name == "TGraphErrors":
+            self.construct_from_TGraphErrors(uproot_object)
+        # Initialise TGraph constructor
+        elif class_name == "TGraph":
+            self.construct_from_TGraph(uproot_object)
+        else:
+            raise ValueError("{0}, of class {1}, is not a convertible uproot object".format(uproot_object, class_name))
+
+    @staticmethod
+    def valid_input(test_object):
+        """Check that the input object was read by uproot. This does not import uproot.
+
+        :param test_object: input object to invesigate
+        :type test_object: object
+        :return: whether the input object was read by uproot
+        :rtype: bool
+        """
+        return type(test_object).__module__.split(".")[0] in ["uproot", "uproot3"]
+
+    @staticmethod
+    def get_class_name(uproot_object):
+        """Get the name of the ROOT class that an uproot object was read from.
+
+        :param uproot_object: uproot input
+        :type uproot_object: uproot.rootio.ROOTObject
+        :return: ROOT class name, eg. TH1D
+        :rtype: str
+        """
+        # uproot 4 onwards records this as 'classname', uproot 3 names the Python class after it
+        return getattr(uproot_object, "classname", type(uproot_object).__name__)
+
+    def construct_from_TH1(self, input_TH1):
+        """Read TH1 into x, y dimensions.
+
+        :param input_TH1: input TH1
+        :type input_TH1: uproot.rootio.TH1
+        """
+        contents, errors, (x_edges,) = _histogram_arrays(input_TH1)
+        self.x_values, self.x_error_pairs = _centres_error_pairs(x_edges)
+        self.y_values = contents
+        self.y_error_pairs = np.column_stack((errors, errors))
+        self.nPoints = len(self.x_values)
+
+    def construct_from_TH2(self, input_TH2):
+        """Read TH2 into x, y, z dimensions.
+
+        :param input_TH2: input TH2
+        :type input_TH2: uproot.rootio.TH2
+        """
+        contents, errors, (x_edges, y_edges) = _histogram_arrays(input_TH2)
+        self.x_values, self.x_error_pairs = _centres_error_pairs(x_edges)
+        self.y_values, self.y_error_pairs = _centres_error_pairs(y_edges)
+        # uproot returns (x, y)-indexed arrays: transpose so that x varies fastest, as for ROOT input
+        self.z_values = contents.T.ravel()
+        self.z_error_pairs = np.column_stack((errors.T.ravel(), errors.T.ravel()))
+        self.nPoints = len(self.z_values)
+
+    def construct_from_TGraph(self, input_TGraph):
+        """Read TGraph into x, y dimensions.
+
+        :param input_TGraph: input TGraph
+        :type input_TGraph: uproot.rootio.TGraph
+        """
+        self.x_values, self.y_values = _graph_array(input_TGraph, "x"), _graph_array(input_TGraph, "y")
+        self.x_error_pairs = np.zeros((len(self.x_values), 2))
+        self.y_error_pairs = np.zeros((len(self.y_values), 2))
+        self.nPoints = len(self.x_values)
+
+    def construct_from_TGraphErrors(self, input_TGraphErrors):
+        """Read TGraphErrors into x, y dimensions.
+
+        :param input_TGraphErrors: input TGraphErrors
+        :type input_TGraphErrors: uproot.rootio.TGraphErrors
+        """
+        x_errors, y_errors = _graph_array(input_TGraphErrors, "x", "mean"), _graph_array(input_TGraphErrors, "y", "mean")
+        self.x_values = _graph_array(input_TGraphErrors, "x")
+        self.x_error_pairs = np.column_stack((x_errors, x_errors))
+        self.y_values = _graph_array(input_TGraphErrors, "y")
+        self.y_error_pairs = np.column_stack((y_errors, y_errors))
+        self.nPoints = len(self.x_values)
+
+    def construct_from_TGraphAsymmErrors(self, input_TGraphAsymmErrors):
+        """Read TGraphAsymmErrors into x, y dimensions.
+
+        The x points are recentred such that the x errors are symmetric.
+
+        :param input_TGraphAsymmErrors: input TGraphAsymmErrors
+        :type input_TGraphAsymmErrors: uproot.rootio.TGraphAsymmErrors
+        """
+        x_errors_low, x_errors_high = _graph_array(input_TGraphAsymmErrors, "x", "low"), _graph_array(input_TGraphAsymmErrors, "x", "high")
+        x_errors = (x_errors_high + x_errors_low) / 2.0
+        self.x_values = _graph_array(input_TGraphAsymmErrors, "x") + (x_errors_high - x_errors_low) / 2.0
+        self.x_error_pairs = np.column_stack((x_errors, x_errors))
+        self.y_values = _graph_array(input_TGraphAsymmErrors, "y")
+        self.y_error_pairs = np.column_stack((_graph_array(input_TGraphAsymmErrors, "y", "low"), _graph_array(input_TGraphAsymmErrors, "y", "high")))
+        self.nPoints = len(self.x_values)
+
+
+def _centres_error_pairs(edges):
+    """Get bin centres and half-width error pairs from bin edges.
+
+    :param edges: bin edges
+    :type edges: np.array
+    :return: bin centres and error pairs
+    :rtype: (np.array, np.array)
+    """
+    edges = np.asarray(edges, dtype=np.float64)
+    half_widths = 0.5 * (edges[1:] - edges[:-1])
+    return edges[:-1] + half_widths, np.column_stack((half_widths, half_widths))
+
+
+def _histogram_arrays(uproot_histogram):
+    """Get contents, symmetric errors and the bin edges along each axis of an uproot histogram, excluding underflow and overflow.
+
+    :param uproot_histogram: input histogram
+    :type uproot_histogram: uproot.rootio.TH1
+    :return: contents, errors and a tuple of bin edges
+    :rtype: (np.array, np.array, tuple(np.array))
+    """
+    if callable(getattr(uproot_histogram, "to_numpy", None)):
+        # uproot 4 onwards
+        numpy_form = uproot_histogram.to_numpy(flow=False)
+        contents, edges = numpy_form[0], tuple(numpy_form[1:])
+        variances = uproot_histogram.variances(flow=False)
+    else:
+        # uproot 3
+        contents, edges, variances = uproot_histogram.values, uproot_histogram.edges, uproot_histogram.variances
+        if not isinstance(edges, tuple):
+            edges = (edges,)
+    contents = np.asarray(contents, dtype=np.float64)
+    # Histograms without stored weights have Poisson errors
+    variances = np.abs(contents) if variances is None else np.asarray(variances, dtype=np.float64)
+    return contents, np.sqrt(variances), edges
+
+
+def _graph_array(uproot_graph, axis, which=None):
+    """Get the values or errors along one axis of an uproot graph.
+
+    :param uproot_graph: input graph
+    :type uproot_graph: uproot.rootio.TGraph
+    :param axis: which axis to use ('x' or 'y')
+    :type axis: str
+    :param which: None for the values, otherwise which errors to get ('mean', 'low' or 'high')
+    :type which: str
+    :return: values or errors
+    :rtype: np.array
+    """
+    if hasattr(uproot_graph, "xvalues"):
+        # uproot 3
+        attribute = {None: "values", "mean": "errors", "low": "errorslow", "high": "errorshigh"}[which]
+        values = getattr(uproot_graph, "{0}{1}".format(axis, attribute))
+    elif which is None:
+        # uproot 4 onwards
+        values = uproot_graph.values(axis=axis)
+    else:
+        values = uproot_graph.errors(which=which, axis=axis)
+    return np.asarray(values, dtype=np.float64)
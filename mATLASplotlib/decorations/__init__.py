@@ -1,7 +1,8 @@
-"""This subpackage contains the Legend class and the draw_text and draw_ATLAS_text functions."""
+"""This subpackage contains the Legend class and the draw_text, draw_ATLAS_text and get_text_extent functions."""
 
 from legend import Legend
 from atlas_text import draw_ATLAS_text
 from text import draw_text
+from text_metrics import get_text_extent
 
-__all__ = ["draw_ATLAS_text", "draw_text", "Legend"]
+__all__ = ["draw_ATLAS_text", "draw_text", "get_text_extent", "Legend"]
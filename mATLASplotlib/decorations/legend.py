@@ -54,8 +54,8 @@ class Legend(object):
         _legend.get_frame().set_linewidth(0)
         _legend.get_frame().set_alpha(0.0)
         fontsize = self.default_fontsize if fontsize is None else fontsize
-        matplotlib.pyplot.setp(_legend.get_texts(), fontsize=fontsize)
         for text in _legend.get_texts():
+            text.set_fontsize(fontsize)
             text.set_va("bottom")
 
     def __get_legend_handles_labels(self, axes):
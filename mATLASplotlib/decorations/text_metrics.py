@@ -0,0 +1,49 @@
+"""This module provides the ``get_text_extent()`` function."""
+from matplotlib.text import Text
+from ..caching import BoundedCache
+from ..matplotlib_wrapper import render_lock
+
+# Agg renderers used for measuring text, one for each resolution
+_renderers = BoundedCache()
+
+# Previously measured extents, keyed by text, font properties and resolution
+_extents = BoundedCache()
+
+
+def get_text_extent(text, font_properties, dpi):
+    """Measure a single line of text as it would be drawn by the Agg renderer.
+    Measurements are cached, so measuring the same text again is very fast.
+
+    :param text: text to measure, which may contain mathtext
+    :type text: str
+    :param font_properties: font to draw the text in
+    :type font_properties: matplotlib.font_manager.FontProperties
+    :param dpi: resolution in dots per inch
+    :type dpi: float
+    :return: width, height and descent of the text in pixels
+    :rtype: tuple(float)
+    """
+    key = (text, font_properties.copy(), dpi)
+    with render_lock:
+        extent = _extents.get(key, None)
+        if extent is None:
+            clean_text, is_math = Text.is_math_text(text)
+            extent = __get_renderer(dpi).get_text_width_height_descent(clean_text, font_properties, ismath=is_math)
+            _extents[key] = extent
+        return extent
+
+
+def __get_renderer(dpi):
+    """Retrieve a renderer for measuring text, creating it if necessary.
+
+    :param dpi: resolution in dots per inch
+    :type dpi: float
+    :return: renderer at this resolution
+    :rtype: matplotlib.backends.backend_agg.RendererAgg
+    """
+    renderer = _renderers.get(dpi, None)
+    if renderer is None:
+        from matplotlib.backends.backend_agg import RendererAgg
+        renderer = RendererAgg(1, 1, dpi)
+        _renderers[dpi] = renderer
+    return renderer
@@ -1,4 +1,5 @@
 """This subpackage contains utility label formatters"""
 from label import force_extra_ticks, force_ndp
+from ticks import get_auto_ticks, LogMinorLocator
 
-__all__ = ["force_extra_ticks", "force_ndp"]
+__all__ = ["force_extra_ticks", "force_ndp", "get_auto_ticks", "LogMinorLocator"]
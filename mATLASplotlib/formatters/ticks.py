@@ -0,0 +1,90 @@
+"""This module provides the ``LogMinorLocator`` class and the ``get_auto_ticks()`` function."""
+import numpy as np
+from matplotlib.ticker import Locator
+from ..caching import BoundedCache
+
+# Previously calculated log-scale minor ticks, keyed by axis range and minor tick multiples
+_log_minor_ticks = BoundedCache()
+
+# Previously calculated automatic ticks, keyed by axis range, tick intervals and approximate number of ticks
+_auto_ticks = BoundedCache()
+
+
+class LogMinorLocator(Locator):
+    """Place minor ticks on a log-scale axis at multiples of each power of ten.
+
+    Ticks are only calculated for the decades which are visible.
+    These are cached for each axis range, so subplots with the same range share their ticks.
+    """
+
+    def __init__(self, subs=(2, 3, 4, 5, 6, 7, 8, 9)):
+        """Set up the locator.
+
+        :param subs: multiples of each power of ten to place ticks at
+        :type subs: iterable
+        """
+        self.subs = tuple(subs)
+
+    def __call__(self):
+        """Get the tick positions for the current view of the axis.
+
+        :return: tick positions
+        :rtype: np.array
+        """
+        vmin, vmax = self.axis.get_view_interval()
+        if vmin <= 0.0:
+            vmin = self.axis.get_minpos()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        """Get the tick positions for every decade between vmin and vmax.
+
+        :param vmin: lower edge of the axis
+        :type vmin: float
+        :param vmax: upper edge of the axis
+        :type vmax: float
+        :return: tick positions
+        :rtype: np.array
+        :raises ValueError: the axis range is not positive
+        """
+        if vmin > vmax:
+            vmin, vmax = vmax, vmin
+        if vmin <= 0.0 or not np.isfinite(vmin) or not np.isfinite(vmax):
+            raise ValueError("Axis range ({0}, {1}) cannot be log-scaled".format(vmin, vmax))
+        key = (float(vmin), float(vmax), self.subs)
+        ticks = _log_minor_ticks.get(key, None)
+        if ticks is None:
+            powers = np.arange(np.floor(np.log10(vmin)), np.floor(np.log10(vmax)) + 1)
+            ticks = np.outer(10.0**powers, self.subs).ravel()
+            # Cached ticks are shared by different axes so should not be modified
+            ticks.flags.writeable = False
+            _log_minor_ticks[key] = ticks
+        return ticks
+
+
+def get_auto_ticks(axis_range, tick_intervals, n_approximate=4):
+    """Choose ticks to be sensibly spaced and always include 1.0.
+
+    :param axis_range: lower and upper edges of the axis
+    :type axis_range: iterable
+    :param tick_intervals: allowed intervals between ticks
+    :type tick_intervals: iterable
+    :param n_approximate: approximate number of ticks to use.
+    :type n_approximate: int
+    :return: list of tick positions
+    :rtype: list
+    """
+    axis_min, axis_max = float(axis_range[0]), float(axis_range[1])
+    key = (axis_min, axis_max, tuple(tick_intervals), n_approximate)
+    ticks = _auto_ticks.get(key, None)
+    if ticks is None:
+        # Underestimate the interval size since we might be removing the highest tick
+        interval = 0.99 * abs(axis_max - axis_min)
+        intervals = np.asarray(tick_intervals, dtype=float)
+        tick_size = intervals[np.argmin(np.abs((interval / intervals) - n_approximate))]
+        ticks = np.arange(1.0 - 10 * tick_size, 1.0 + 10 * tick_size, tick_size)
+        # Remove topmost tick if it would be at the top of the axis
+        ticks = ticks[~np.isclose(ticks, axis_max)].tolist()
+        _auto_ticks[key] = ticks
+    # Return a copy since the caller may modify the list
+    return list(ticks)
@@ -1,4 +1,9 @@
-"""This module sets the default matplotlib backend - must be done before local imports."""
-import matplotlib
+"""This module contains shared matplotlib state.
 
-matplotlib.use("pdf")
+No matplotlib backend is selected here: canvases draw on their own Agg canvas and each output is written by the backend for its format.
+"""
+import threading
+
+#: Lock held while drawing figures or measuring text.
+#: matplotlib shares its font objects and mathtext parser between figures, so these must not be used by two threads at once.
+render_lock = threading.RLock()
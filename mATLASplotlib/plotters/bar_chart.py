@@ -1,5 +1,6 @@
 """This module provides the ``BarChart`` class."""
 import logging
+import numpy as np
 from matplotlib.patches import Rectangle
 from base_plotter import BasePlotter
 
@@ -7,7 +8,11 @@ logger = logging.getLogger("mATLASplotlib.plotters")
 
 
 class BarChart(BasePlotter):
-    """Plot bar chart."""
+    """Plot bar chart.
+
+    By default each bin is drawn as a separate bar.
+    The 'stepped bar' style instead draws the whole histogram as a single filled region with a single outline, which is much faster for histograms with many bins.
+    """
 
     def add_to_axes(self, axes, dataset, **kwargs):
         """Add the chosen dataset to the chosen axes.
@@ -35,12 +40,25 @@ class BarChart(BasePlotter):
         # Add any other user-provided arguments
         self.plot_args.update(kwargs)
 
-        # First draw the edges if requested
-        if edgecolour is not None:
-            axes.bar(dataset.x_points, height=dataset.y_points, width=dataset.x_bin_widths, color=None, edgecolor=edgecolour, linewidth=linewidth)
+        if "stepped" in self.plot_style:
+            # First draw the outline if requested - this goes just underneath the filled region so that it is partly covered, as for separate bars
+            if edgecolour is not None:
+                x_outline = np.concatenate(([dataset.x_all_bin_edges[0]], dataset.x_all_bin_edges, [dataset.x_all_bin_edges[-1]]))
+                y_outline = np.concatenate(([0], dataset.y_at_x_bin_edges, [0]))
+                axes.plot(x_outline, y_outline, color=edgecolour, linewidth=linewidth, zorder=0.99)
+
+            # Draw the whole histogram as a single filled region, which should stop autoscaling at zero as bars do
+            self.plot_args.setdefault("linewidth", 0)
+            filled_region = axes.fill_between(dataset.x_all_bin_edges, 0, dataset.y_at_x_bin_edges, **self.plot_args)
+            filled_region.sticky_edges.y.append(0)
+            axes.autoscale_view()
+        else:
+            # First draw the edges if requested
+            if edgecolour is not None:
+                axes.bar(dataset.x_points, height=dataset.y_points, width=dataset.x_bin_widths, color=None, edgecolor=edgecolour, linewidth=linewidth)
 
-        # Draw main bar - expand the widths slightly to fill in zero-width gaps
-        axes.bar(dataset.x_points, height=dataset.y_points, width=[1.004 * x for x in dataset.x_bin_widths], edgecolor=None, **self.plot_args)
+            # Draw main bar - expand the widths slightly to fill in zero-width gaps
+            axes.bar(dataset.x_points, height=dataset.y_points, width=1.004 * dataset.x_bin_widths, edgecolor=None, **self.plot_args)
 
         # Add a proxy artist with correct edge and facecolours
         if edgecolour is None:
@@ -32,6 +32,7 @@ class BinnedBand(BasePlotter):
             * **label** (*str*) -- label to use when this appears in a legend
             * **linecolour** (*float*) -- which colour to use for the main line and for hatches
             * **linewidth** (*str*) -- how wide to draw the line
+            * **rasterize** (*bool*) -- draw the band and line as a bitmap in vector outputs, which keeps these small for very large datasets
         """
         # Construct plotting argument dictionary
         self.plot_args["alpha"] = kwargs.pop("alpha", None)          # Default alpha: None
@@ -44,6 +45,7 @@ class BinnedBand(BasePlotter):
         line_style = kwargs.pop("linestyle", None)                   # Default style: None
         line_width = kwargs.pop("linewidth", 2)                      # Default linewidth: 2
         plot_label = kwargs.pop("label", None)                       # Default label: None
+        rasterize = kwargs.pop("rasterize", False)                   # Default: False
 
         # Add any other user-provided arguments
         self.plot_args.update(kwargs)
@@ -51,10 +53,10 @@ class BinnedBand(BasePlotter):
         # Plot the central line
         if "central line" in self.plot_style:
             if "central line stepped" in self.plot_style:
-                axes.plot(dataset.x_all_bin_edges, dataset.y_at_x_bin_edges, drawstyle="steps-pre", color=line_colour, linestyle=line_style, linewidth=line_width)
+                axes.plot(dataset.x_all_bin_edges, dataset.y_at_x_bin_edges, drawstyle="steps-pre", color=line_colour, linestyle=line_style, linewidth=line_width, rasterized=rasterize)
             else:
                 _, _, barlinecols = axes.errorbar(dataset.x_points, dataset.y_points, xerr=np.transpose(dataset.x_error_pairs),
-                                                  fmt="", markeredgewidth=0, linestyle="None", color=line_colour, linewidth=line_width)
+                                                  fmt="", markeredgewidth=0, linestyle="None", color=line_colour, linewidth=line_width, rasterized=rasterize)
                 if line_style is not None:
                     barlinecols[0].set_linestyle(line_style)
 
@@ -62,11 +64,11 @@ class BinnedBand(BasePlotter):
         if self.plot_args["hatch"] is not None:
             self.plot_args["edgecolor"] = hatch_colour
 
-        # Plot the band
+        # Plot the band - legend proxies are drawn without rasterisation, so this is not part of plot_args
         if plot_label is None:
-            axes.fill_between(dataset.band_edges_x, dataset.band_edges_y_low, dataset.band_edges_y_high, **self.plot_args)
+            axes.fill_between(dataset.band_edges_x, dataset.band_edges_y_low, dataset.band_edges_y_high, rasterized=rasterize, **self.plot_args)
         else:
-            axes.fill_between(dataset.band_edges_x, dataset.band_edges_y_low, dataset.band_edges_y_high, **self.plot_args)
+            axes.fill_between(dataset.band_edges_x, dataset.band_edges_y_low, dataset.band_edges_y_high, rasterized=rasterize, **self.plot_args)
 
             if "central line" in self.plot_style:
                 proxy_artist = Ellipse((0, 0), 0, 0, axes=axes, label=plot_label, linestyle=line_style, facecolor=self.plot_args["facecolor"], edgecolor=line_colour)
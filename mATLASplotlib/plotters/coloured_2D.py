@@ -1,13 +1,18 @@
 """This module provides the ``Coloured2D`` class."""
 import logging
-import matplotlib.pyplot as pyplot
+import matplotlib.cm
+import numpy as np
 from base_plotter import BasePlotter
 
 logger = logging.getLogger("mATLASplotlib.plotters")
 
 
 class Coloured2D(BasePlotter):
-    """Plot as points in the x-y plane"""
+    """Plot as points in the x-y plane
+
+    The z-values are placed directly onto a grid of the x and y bin edges, rather than being histogrammed again.
+    Bins of the grid which contain no points (for example gaps between non-contiguous bins) are drawn as zero.
+    """
 
     # Add to canvas
     def add_to_axes(self, axes, dataset, **kwargs):
@@ -19,23 +24,65 @@ class Coloured2D(BasePlotter):
         :type dataset: matplotlib.axes
 
         :Keyword Arguments:
+            * **as_image** (*bool*) -- draw uniformly binned data as an image, which is much faster for large numbers of bins (True by default)
             * **colour_map** (*str*) -- which colour map to use
             * **with_key** (*bool*) -- draw the key (True by default)
         """
         # Construct plotting argument dictionary
-        self.plot_args["cmap"] = getattr(pyplot.cm, kwargs.pop("colour_map", "Purples"))  # Default colour-map: Purples
+        self.plot_args["cmap"] = getattr(matplotlib.cm, kwargs.pop("colour_map", "Purples"))  # Default colour-map: Purples
 
         # Extract other known arguments from kwargs
+        as_image = kwargs.pop("as_image", True)  # Default True
         with_key = kwargs.pop("with_key", True)  # Default True
 
         # Add any other user-provided arguments
         self.plot_args.update(kwargs)
 
-        x_values, y_values = dataset.construct_2D_bin_list(axes="xy")
-        assert len(x_values) == len(y_values) == len(dataset.z_points)
-        _, _, _, axes_image = axes.hist2d(x_values, y_values,
-                                          bins=[dataset.x_bin_edges, dataset.y_bin_edges],
-                                          weights=dataset.z_points, **self.plot_args)
+        x_edges, y_edges = dataset.x_bin_edges, dataset.y_bin_edges
+        z_grid = self.__construct_z_grid(dataset, x_edges, y_edges)
+        if as_image and _is_uniform(x_edges) and _is_uniform(y_edges):
+            axes_image = axes.imshow(z_grid, extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                                     origin="lower", aspect="auto", interpolation="nearest", **self.plot_args)
+        else:
+            axes_image = axes.pcolormesh(x_edges, y_edges, z_grid, **self.plot_args)
+        axes.set_xlim(x_edges[0], x_edges[-1])
+        axes.set_ylim(y_edges[0], y_edges[-1])
         if with_key:
             colourbar = axes.get_figure().colorbar(axes_image, ax=axes, **self.plot_args)
             colourbar.solids.set_rasterized(True)
+
+    @staticmethod
+    def __construct_z_grid(dataset, x_edges, y_edges):
+        """Place the z-values of a dataset onto a grid of bin edges.
+
+        :param dataset: dataset with one z-value for each (x, y) combination, with x varying fastest
+        :type dataset: Dataset
+        :param x_edges: x bin edges of the grid
+        :type x_edges: np.array
+        :param y_edges: y bin edges of the grid
+        :type y_edges: np.array
+        :return: grid of z-values indexed by [y bin, x bin]
+        :rtype: np.array
+        """
+        z_values = np.reshape(dataset.z_points, (len(dataset.y_points), len(dataset.x_points)))
+        x_indices = np.clip(np.searchsorted(x_edges, dataset.x_points, side="right") - 1, 0, len(x_edges) - 2)
+        y_indices = np.clip(np.searchsorted(y_edges, dataset.y_points, side="right") - 1, 0, len(y_edges) - 2)
+        z_grid = np.zeros((len(y_edges) - 1, len(x_edges) - 1))
+        if len(np.unique(x_indices)) == len(x_indices) and len(np.unique(y_indices)) == len(y_indices):
+            z_grid[np.ix_(y_indices, x_indices)] = z_values
+        else:
+            # Use unbuffered addition so that points which share a bin are summed
+            np.add.at(z_grid, np.ix_(y_indices, x_indices), z_values)
+        return z_grid
+
+
+def _is_uniform(bin_edges):
+    """Check whether bin edges are equally spaced.
+
+    :param bin_edges: bin edges
+    :type bin_edges: np.array
+    :return: whether all bins have the same width
+    :rtype: bool
+    """
+    bin_widths = np.diff(bin_edges)
+    return np.allclose(bin_widths, bin_widths[0])
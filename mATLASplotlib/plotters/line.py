@@ -1,8 +1,8 @@
-"""This module provides the ``Line`` class."""
+"""This module provides the ``Line`` and ``DecimatedLine`` classes."""
 
 import logging
 import numpy as np
-from scipy import interpolate
+from matplotlib.lines import Line2D
 from base_plotter import BasePlotter
 
 logger = logging.getLogger("mATLASplotlib.plotters")
@@ -15,8 +15,13 @@ class Line(BasePlotter):
         * `join centres` -- join the centres with straight line segments
         * `smooth` -- draw a smooth line through the points
         * `stepped` -- draw a stepped line graph
+
+    Lines joining the centres of very large datasets are decimated before drawing (see the ``decimate`` argument of :py:meth:`add_to_axes`).
     """
 
+    #: Number of points above which lines are decimated unless this is explicitly disabled
+    decimation_threshold = 100000
+
     def add_to_axes(self, axes, dataset, **kwargs):
         """Add the chosen dataset to the chosen axes.
 
@@ -27,10 +32,12 @@ class Line(BasePlotter):
 
         :Keyword Arguments:
             * **colour** (*str*) -- which face colour to use
+            * **decimate** (*bool* or *int*) -- for lines joining the centres, draw only the first, last, lowest and highest points in each pixel column of the current view (see :py:class:`DecimatedLine`) so that very large datasets draw quickly. An integer instead divides the data range into this number of equal-width columns once, when the line is added. This needs sorted x-values. By default lines with more than ``decimation_threshold`` points and no markers are decimated when possible.
             * **label** (*str*) -- label to use when this appears in a legend
             * **linestyle** (*str*) -- which style (dotted/dashed/solid etc.) to draw the line with
             * **linewidth** (*str*) -- how wide to draw the line
             * **marker** (*str*) -- which marker to use
+            * **rasterize** (*bool*) -- draw the line as a bitmap in vector outputs, which keeps these small for very large datasets
         """
         # Construct plotting argument dictionary
         self.plot_args["color"] = kwargs.pop("colour", "black")         # Default colour: black
@@ -38,6 +45,10 @@ class Line(BasePlotter):
         self.plot_args["linestyle"] = kwargs.pop("linestyle", "solid")  # Default linewidth: solid
         self.plot_args["linewidth"] = kwargs.pop("linewidth", 2)        # Default linewidth: 2
         self.plot_args["marker"] = kwargs.pop("marker", None)           # Default marker: dot
+        self.plot_args["rasterized"] = kwargs.pop("rasterize", False)   # Default: False
+
+        # Extract other known arguments from kwargs
+        decimate = kwargs.pop("decimate", None)                         # Default: decide automatically
 
         # Add any other user-provided arguments
         self.plot_args.update(kwargs)
@@ -50,11 +61,137 @@ class Line(BasePlotter):
             line_draw_style = "stepped"
 
         if line_draw_style == "join centres":
-            axes.plot(dataset.x_points, dataset.y_points, **self.plot_args)
+            x_values, y_values = dataset.x_points, dataset.y_points
+            if decimate is None:
+                decimate = len(x_values) > self.decimation_threshold and self.plot_args["marker"] in (None, "None", "none", "") and _is_sorted(x_values)
+            if decimate and not _is_sorted(x_values):
+                logger.warning("Not decimating line since its x-values are not sorted")
+            elif decimate is True:
+                axes.add_line(DecimatedLine(x_values, y_values, **self.plot_args))
+                axes.autoscale_view()
+                return
+            elif decimate:
+                kept = _m4_indices(x_values, y_values, int(decimate))
+                x_values, y_values = x_values[kept], y_values[kept]
+            axes.plot(x_values, y_values, **self.plot_args)
         elif line_draw_style == "smooth":
+            # scipy is slow to import so only do so when it is needed
+            from scipy import interpolate
             spline = interpolate.interp1d(dataset.x_points, dataset.y_points, kind="cubic")
             x_spline = np.linspace(min(dataset.x_points), max(dataset.x_points), 10 * len(dataset.x_points))
             y_spline = spline(x_spline)
             axes.plot(x_spline, y_spline, **self.plot_args)
         elif line_draw_style == "stepped":
             axes.plot(dataset.x_all_bin_edges, dataset.y_at_x_bin_edges, drawstyle="steps-pre", **self.plot_args)
+
+
+def _is_sorted(values):
+    """Check whether values are in ascending order.
+
+    :param values: values to check
+    :type values: np.array
+    :rtype: bool
+    """
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def _m4_indices(x_values, y_values, n_columns):
+    """Find the points which are needed to draw a line that is divided into columns, using M4 aggregation.
+    Within each equal-width column in x, only the first, last, lowest and highest points are kept.
+    This draws identically to the full line as long as each column is no wider than a pixel.
+
+    :param x_values: sorted x-values
+    :type x_values: np.array
+    :param y_values: y-values
+    :type y_values: np.array
+    :param n_columns: number of columns
+    :type n_columns: int
+    :return: indices of the points to keep, in their original order
+    :rtype: np.array
+    """
+    if len(x_values) <= 4 * n_columns:
+        return np.arange(len(x_values))
+    column_boundaries = x_values[0] + (x_values[-1] - x_values[0]) * np.arange(1, n_columns) / float(n_columns)
+    return _m4_column_indices(x_values, y_values, column_boundaries, 0, len(x_values))
+
+
+def _m4_column_indices(x_values, y_values, column_boundaries, start, end):
+    """Find the first, last, lowest and highest points in each column, for the points between start and end.
+    Points with a y-value of NaN are also kept, since these break the line.
+
+    :param x_values: sorted x-values
+    :type x_values: np.array
+    :param y_values: y-values
+    :type y_values: np.array
+    :param column_boundaries: sorted x-values of the boundaries between columns
+    :type column_boundaries: np.array
+    :param start: index of the first point to consider
+    :type start: int
+    :param end: index after the last point to consider
+    :type end: int
+    :return: indices of the points to keep, in their original order
+    :rtype: np.array
+    """
+    # Since x is sorted, each column is a contiguous run of points which can be found by bisection
+    column_edges = np.unique(np.clip(np.r_[start, np.searchsorted(x_values, column_boundaries), end], start, end))
+    if len(column_edges) < 2:
+        return np.arange(start, end)
+    column_offsets, column_lengths = column_edges[:-1] - start, np.diff(column_edges)
+    y_considered = y_values[start:end]
+    kept = [np.flatnonzero(np.isnan(y_considered)), column_offsets, column_offsets + column_lengths - 1]
+    # NaN values are ignored by fmin and fmax, and never match the extreme value of a column
+    with np.errstate(invalid="ignore"):
+        for reduction in (np.fmin, np.fmax):
+            matches = np.flatnonzero(y_considered == np.repeat(reduction.reduceat(y_considered, column_offsets), column_lengths))
+            # Keep only the first match in each column, as argmin and argmax would
+            first_matches = np.searchsorted(matches, column_offsets)
+            kept.append(matches[first_matches[first_matches < len(matches)]])
+    return start + np.unique(np.concatenate(kept))
+
+
+class DecimatedLine(Line2D):
+    """Line which is decimated with M4 aggregation each time that it is drawn.
+
+    Each pixel column of the current view is split into ``columns_per_pixel`` columns.
+    Only the first, last, lowest and highest points in each of these are drawn, which looks the same as the full line.
+    Since this is done at draw time, it remains correct for log-scale axes and after the axis limits are changed.
+    The x-values must be sorted.
+    """
+
+    #: Number of columns to split each pixel into, which keeps the antialiased edges of dense lines close to those of the full line
+    columns_per_pixel = 8
+
+    def get_decimated_indices(self):
+        """Find the points which are needed to draw this line in its current view.
+
+        :return: indices of the points to draw
+        :rtype: np.array
+        """
+        x_values, y_values = np.asarray(self.get_xdata(), dtype=float), np.asarray(self.get_ydata(), dtype=float)
+        if self.axes is None or self.get_transform() != self.axes.transData or len(x_values) < 2:
+            return np.arange(len(x_values))
+        # Find the columns in display coordinates and transform their boundaries back to x-values, using a y-value which is valid for any scale
+        x_display = np.arange(np.floor(self.axes.bbox.x0), np.ceil(self.axes.bbox.x1) + 1, 1.0 / self.columns_per_pixel)
+        y_valid = np.full(len(x_display), self.axes.get_ylim()[1])
+        column_boundaries = np.sort(self.axes.transData.inverted().transform(np.column_stack([x_display, y_valid]))[:, 0])
+        # Only consider the visible points, together with their neighbours outside the view
+        start = max(np.searchsorted(x_values, column_boundaries[0]) - 1, 0)
+        end = min(np.searchsorted(x_values, column_boundaries[-1], side="right") + 1, len(x_values))
+        return _m4_column_indices(x_values, y_values, column_boundaries, start, end)
+
+    def draw(self, renderer):
+        """Draw the decimated line.
+
+        :param renderer: renderer to draw with
+        :type renderer: matplotlib.backend_bases.RendererBase
+        """
+        if not self.get_visible():
+            return
+        kept = self.get_decimated_indices()
+        decimated_line = Line2D(np.asarray(self.get_xdata())[kept], np.asarray(self.get_ydata())[kept])
+        decimated_line.update_from(self)
+        decimated_line.set_rasterized(self.get_rasterized())
+        decimated_line.set_figure(self.figure)
+        decimated_line.axes = self.axes
+        decimated_line.draw(renderer)
+        self.stale = False
@@ -41,6 +41,7 @@ class Scatter(BasePlotter):
             * **linestyle** (*str*) -- which style (dotted/dashed/solid etc.) to draw the line with if `join centers` is specified
             * **linewidth** (*str*) -- how wide to draw the line
             * **marker** (*str*) -- which marker to use
+            * **rasterize** (*bool*) -- draw the points and error bars as a bitmap in vector outputs, which keeps these small for very large datasets
             * **with_error_bar_caps** (*bool*) -- whether to draw caps on the end of the error bars
         """
         # Construct plotting argument dictionary
@@ -48,6 +49,7 @@ class Scatter(BasePlotter):
         self.plot_args["label"] = kwargs.pop("label", None)      # Default label: None
         self.plot_args["linewidth"] = kwargs.pop("linewidth", 2)  # Default linewidth: 2
         self.plot_args["marker"] = kwargs.pop("marker", "o")     # Default marker: dot
+        self.plot_args["rasterized"] = kwargs.pop("rasterize", False)  # Default: False
 
         # Extract other known arguments from kwargs
         linestyle = kwargs.pop("linestyle", "solid")                   # Default linestyle: solid
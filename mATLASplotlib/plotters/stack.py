@@ -1,13 +1,18 @@
 """This module provides the ``Stack`` class."""
 
 import logging
+import numpy as np
 from base_plotter import BasePlotter
 
 logger = logging.getLogger("mATLASplotlib.plotters")
 
 
 class Stack(BasePlotter):
-    """Plot as part of a vertically stacked histogram."""
+    """Plot as part of a vertically stacked histogram.
+
+    By default each bin is drawn as a separate bar.
+    The 'stepped stack' style instead draws each layer as a single filled region, which is much faster for histograms with many bins.
+    """
 
     def add_to_axes(self, axes, dataset, **kwargs):
         """Add the chosen dataset to the chosen axes.
@@ -23,9 +28,13 @@ class Stack(BasePlotter):
             * **hatchcolour** (*str*) -- which hatch colour to use
             * **label** (*str*) -- label to use when this appears in a legend
             * **outlinewidth** (*str*) -- how wide to draw the outline
+
+        :raises ValueError: dataset has a different number of bins from the layers already in the stack
         """
         # Construct plotting argument dictionary
-        self.plot_args["color"] = kwargs.pop("colour", "black")               # Default colour: black
+        # Filled regions need an explicit face colour, since 'color' would also override the hatch colour
+        colour_argument = "facecolor" if "stepped" in self.plot_style else "color"
+        self.plot_args[colour_argument] = kwargs.pop("colour", "black")       # Default colour: black
         if "hatch" in kwargs:
             self.plot_args["hatch"] = kwargs.pop("hatch")                     # Default hatch: do not apply
             self.plot_args["edgecolor"] = kwargs.pop("hatchcolour", "white")  # Default colour: white
@@ -37,10 +46,19 @@ class Stack(BasePlotter):
 
         # Initialise stack bottom
         if not hasattr(axes, "stack_bottom"):
-            axes.stack_bottom = [0] * len(dataset.y_points)
+            axes.stack_bottom = np.zeros(len(dataset.y_points))
+        if len(dataset.y_points) != len(axes.stack_bottom):
+            raise ValueError("Cannot stack a dataset with {0} bins on top of layers with {1} bins".format(len(dataset.y_points), len(axes.stack_bottom)))
+        stack_top = axes.stack_bottom + dataset.y_points
 
-        # Plot with edge colour first if requested
-        axes.bar(dataset.x_points, height=dataset.y_points, width=[1.004 * x for x in dataset.x_bin_widths], bottom=axes.stack_bottom, **self.plot_args)
+        if "stepped" in self.plot_style:
+            # Draw the whole layer as one filled region between the previous and new stack heights, which should stop autoscaling at its base as bars do
+            filled_region = axes.fill_between(dataset.x_all_bin_edges, np.repeat(axes.stack_bottom, 2), np.repeat(stack_top, 2), **self.plot_args)
+            filled_region.sticky_edges.y.append(axes.stack_bottom.min())
+            axes.autoscale_view()
+        else:
+            # Draw one bar per bin - expand the widths slightly to fill in zero-width gaps
+            axes.bar(dataset.x_points, height=dataset.y_points, width=1.004 * dataset.x_bin_widths, bottom=axes.stack_bottom, **self.plot_args)
 
         # Increment stack bottom
-        axes.stack_bottom = [increment + previous for increment, previous in zip(dataset.y_points, axes.stack_bottom)]
+        axes.stack_bottom = stack_top
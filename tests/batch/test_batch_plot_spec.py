@@ -0,0 +1,49 @@
+import pickle
+import numpy as np
+import pytest
+import mATLASplotlib
+from mATLASplotlib.batch import PlotSpec
+
+
+def test_plot_spec_constructor():
+    spec = PlotSpec("Ratio", "output", extension=["pdf", "png"], shape="landscape")
+    assert spec.canvas_type == "Ratio"
+    assert spec.canvas_kwargs == {"shape": "landscape"}
+    assert spec.extension == ["pdf", "png"]
+    assert spec.calls == []
+
+
+def test_plot_spec_constructor_invalid_canvas():
+    with pytest.raises(ValueError):
+        PlotSpec("Unknown", "output")
+
+
+def test_plot_spec_records_calls():
+    spec = PlotSpec("Simple", "output")
+    spec.plot_dataset([1, 2, 3], [4, 9, 16], style="scatter").set_axis_label("x", "label")
+    assert spec.calls == [("plot_dataset", ([1, 2, 3], [4, 9, 16]), {"style": "scatter"}),
+                          ("set_axis_label", ("x", "label"), {})]
+
+
+def test_plot_spec_invalid_method():
+    spec = PlotSpec("Simple", "output")
+    with pytest.raises(AttributeError):
+        spec.save("output")
+
+
+def test_plot_spec_pickle():
+    spec = PlotSpec("Simple", "output", log_type="y")
+    spec.plot_dataset(mATLASplotlib.converters.Dataset(np.arange(3), np.arange(3) ** 2), style="line")
+    unpickled = pickle.loads(pickle.dumps(spec, pickle.HIGHEST_PROTOCOL))
+    assert unpickled.canvas_kwargs == {"log_type": "y"}
+    assert unpickled.calls[0][0] == "plot_dataset"
+    assert np.array_equal(unpickled.calls[0][1][0].y_points, [0, 1, 4])
+
+
+def test_plot_spec_draw():
+    spec = PlotSpec("Simple", "output")
+    spec.plot_dataset([1, 2, 3], [4, 9, 16], style="scatter")
+    spec.set_axis_range("x", (0, 5))
+    with mATLASplotlib.canvases.Simple() as canvas:
+        spec.draw(canvas)
+        assert canvas.get_axis_range("x") == (0, 5)
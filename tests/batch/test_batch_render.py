@@ -0,0 +1,48 @@
+import os
+import matplotlib.image
+import numpy as np
+from mATLASplotlib.batch import PlotSpec, render, render_many
+
+
+def make_specs(output_directory, n_specs):
+    specs = []
+    for idx in range(n_specs):
+        spec = PlotSpec("Simple", os.path.join(output_directory, "plot{0}".format(idx)), extension=["pdf", "png"])
+        spec.plot_dataset([1, 2, 3], [idx, 2 * idx, 3 * idx], style="line")
+        spec.set_axis_label("x", "x")
+        specs.append(spec)
+    return specs
+
+
+def test_render(tmpdir):
+    spec = make_specs(str(tmpdir), 1)[0]
+    output_names = render(spec)
+    assert output_names == [spec.output_name + ".pdf", spec.output_name + ".png"]
+    assert all(os.path.isfile(output_name) for output_name in output_names)
+
+
+def test_render_many_single_worker(tmpdir):
+    specs = make_specs(str(tmpdir), 3)
+    output_names = render_many(specs, workers=1)
+    assert output_names == [[spec.output_name + ".pdf", spec.output_name + ".png"] for spec in specs]
+    assert all(os.path.isfile(output_name) for names in output_names for output_name in names)
+
+
+def test_render_many_process_pool(tmpdir):
+    specs = make_specs(str(tmpdir), 6)
+    # Drawing in this process first means that workers inherit open fonts
+    render(specs[0])
+    output_names = render_many(specs, workers=2)
+    assert output_names == [[spec.output_name + ".pdf", spec.output_name + ".png"] for spec in specs]
+    assert all(os.path.isfile(output_name) for names in output_names for output_name in names)
+
+
+def test_render_many_thread_pool(tmpdir):
+    specs = make_specs(str(tmpdir.mkdir("threads")), 6)
+    output_names = render_many(specs, workers=3, use_threads=True)
+    assert output_names == [[spec.output_name + ".pdf", spec.output_name + ".png"] for spec in specs]
+    assert all(os.path.isfile(output_name) for names in output_names for output_name in names)
+    # Drawing concurrently should not change the output
+    serial_names = render_many(make_specs(str(tmpdir.mkdir("serial")), 6), workers=1)
+    for names, serial in zip(output_names, serial_names):
+        assert np.array_equal(matplotlib.image.imread(names[1]), matplotlib.image.imread(serial[1]))
@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import pytest
+import mATLASplotlib
+from mATLASplotlib.canvases.async_writer import AsyncWriter
+
+
+def test_async_writer_submit(tmpdir):
+    writer = AsyncWriter(n_threads=2, max_pending=2)
+    file_names = [str(tmpdir.join("output{0}.txt".format(idx))) for idx in range(10)]
+    pending_writes = [writer.submit(file_name, b"contents") for file_name in file_names]
+    for pending_write in pending_writes:
+        pending_write.wait()
+    for file_name in file_names:
+        with open(file_name, "rb") as f_input:
+            assert f_input.read() == b"contents"
+
+
+def test_async_writer_bounded(tmpdir):
+    writer = AsyncWriter(n_threads=1, max_pending=1)
+    # Opening a FIFO for writing blocks until it is opened for reading, which keeps the writer thread busy
+    fifo_name = str(tmpdir.join("fifo"))
+    os.mkfifo(fifo_name)
+    blocked_write = writer.submit(fifo_name, b"fifo")
+    while not writer.queue.empty():
+        time.sleep(0.01)
+    queued_write = writer.submit(str(tmpdir.join("queued.txt")), b"queued")
+    # The queue is now full so another submission should block
+    submitter = threading.Thread(target=writer.submit, args=(str(tmpdir.join("blocked.txt")), b"blocked"))
+    submitter.start()
+    submitter.join(0.2)
+    assert submitter.is_alive()
+    with open(fifo_name, "rb") as f_fifo:
+        assert f_fifo.read() == b"fifo"
+    submitter.join()
+    blocked_write.wait()
+    queued_write.wait()
+
+
+def test_async_writer_error(tmpdir):
+    writer = AsyncWriter(n_threads=1)
+    pending_write = writer.submit(str(tmpdir.join("missing_directory", "output.txt")), b"contents")
+    with pytest.raises(IOError):
+        pending_write.wait()
+
+
+def test_async_writer_error_traceback(tmpdir):
+    writer = AsyncWriter(n_threads=1)
+    pending_write = writer.submit(str(tmpdir.join("missing_directory", "output.txt")), b"contents")
+    with pytest.raises(IOError):
+        try:
+            pending_write.wait()
+        except IOError:
+            # The traceback should lead back to the write in the writer thread
+            assert traceback.extract_tb(sys.exc_info()[2])[-1][2] == "__write_outputs"
+            raise
+
+
+def test_async_writer_flush_at_exit(tmpdir):
+    file_name = str(tmpdir.join("output.txt"))
+    # Exit as soon as the write has been queued
+    code = "from mATLASplotlib.canvases.async_writer import AsyncWriter\n" \
+           "AsyncWriter(n_threads=1).submit({0!r}, b'contents' * 10000000)".format(file_name)
+    subprocess.check_call([sys.executable, "-c", code])
+    with open(file_name, "rb") as f_input:
+        assert f_input.read() == b"contents" * 10000000
+
+
+def test_async_save(tmpdir):
+    output_name = str(tmpdir.join("async_test_output"))
+    with mATLASplotlib.canvases.Simple(async_save=True) as canvas:
+        canvas.plot_dataset([0, 1, 2], [5, 10, 12], style="line")
+        canvas.save(output_name, extension=["pdf", "png"])
+    # Outputs should have been written by the time the canvas is closed
+    assert canvas.pending_writes == []
+    assert os.path.isfile(output_name + ".pdf")
+    assert os.path.isfile(output_name + ".png")
+
+
+def test_async_save_error_raised_on_exit(tmpdir):
+    output_name = str(tmpdir.join("missing_directory", "async_test_output"))
+    with pytest.raises(IOError):
+        with mATLASplotlib.canvases.Simple(async_save=True) as canvas:
+            canvas.save(output_name)
+
+
+def test_async_save_error_does_not_hide_exception(tmpdir):
+    output_name = str(tmpdir.join("missing_directory", "async_test_output"))
+    with pytest.raises(KeyError):
+        with mATLASplotlib.canvases.Simple(async_save=True) as canvas:
+            canvas.save(output_name)
+            raise KeyError("original exception")
@@ -5,9 +5,11 @@ import mATLASplotlib
 
 
 def test_base_close():
+    import matplotlib.pyplot
     n_initial = len(matplotlib.pyplot.get_fignums())
     canvas = mATLASplotlib.canvases.base_canvas.BaseCanvas()
-    assert len(matplotlib.pyplot.get_fignums()) == n_initial + 1
+    # Canvases own their figures rather than registering them with pyplot
+    assert len(matplotlib.pyplot.get_fignums()) == n_initial
     canvas.close()
     assert len(matplotlib.pyplot.get_fignums()) == n_initial
 
@@ -0,0 +1,81 @@
+import matplotlib
+import matplotlib.image
+import numpy as np
+import mATLASplotlib
+
+
+def draw_dirty_canvases(tmpdir):
+    with mATLASplotlib.canvases.Simple(log_type="xy", x_tick_labels=["a", "b", "c"], x_tick_label_size=8) as canvas:
+        canvas.plot_dataset([1, 2, 3], [0.5, 2, 3], [4, 9, 16], None, style="stack", label="stack", colour="red")
+        canvas.plot_dataset([1, 2, 3], [4, 5, 6], [1, 2, 3, 4, 5, 6, 7, 8, 9], style="coloured 2D")
+        canvas.add_legend(0.2, 0.8)
+        canvas.add_ATLAS_label(0.1, 0.9, plot_type="Internal")
+        canvas.set_axis_label("x", "x label")
+        canvas.set_title("title")
+        canvas.save(str(tmpdir.join("pool_test_output_dirty")), "png")
+
+
+def draw_clean_canvas(tmpdir, output_name):
+    output_name = str(tmpdir.join(output_name))
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([1, 2, 3], [0.5, 2, 3], [4, 9, 16], None, style="stack", colour="blue")
+        canvas.set_axis_label("y", "y label")
+        canvas.save(output_name, "png")
+    return matplotlib.image.imread("{0}.png".format(output_name))
+
+
+def test_figure_pool_reuses_figures():
+    with mATLASplotlib.canvases.FigurePool() as pool:
+        with mATLASplotlib.canvases.Simple() as canvas:
+            first_figure, first_axes = canvas.figure, canvas.subplots["main"]
+        with mATLASplotlib.canvases.Simple() as canvas:
+            assert canvas.figure is first_figure
+            assert canvas.subplots["main"] is first_axes
+        # Different shapes and canvas types should not share figures
+        with mATLASplotlib.canvases.Simple(shape="landscape") as canvas:
+            assert canvas.figure is not first_figure
+        with mATLASplotlib.canvases.Ratio() as canvas:
+            assert canvas.figure is not first_figure
+        assert len(pool.all_figures) == 3
+    assert mATLASplotlib.canvases.FigurePool.active() is None
+
+
+def test_figure_pool_panelled_layout():
+    with mATLASplotlib.canvases.FigurePool() as pool:
+        with mATLASplotlib.canvases.Panelled(n_panels=2):
+            pass
+        with mATLASplotlib.canvases.Panelled(n_panels=3) as canvas:
+            assert len(canvas.figure.axes) == 4
+        assert len(pool.all_figures) == 2
+
+
+def test_figure_pool_per_thread():
+    import threading
+    active_pools = []
+    with mATLASplotlib.canvases.FigurePool() as pool:
+        thread = threading.Thread(target=lambda: active_pools.append(mATLASplotlib.canvases.FigurePool.active()))
+        thread.start()
+        thread.join()
+        assert mATLASplotlib.canvases.FigurePool.active() is pool
+    assert active_pools == [None]
+
+
+def test_figure_pool_closes_figures():
+    import matplotlib.pyplot
+    n_initial = len(matplotlib.pyplot.get_fignums())
+    with mATLASplotlib.canvases.FigurePool() as pool:
+        for _ in range(3):
+            with mATLASplotlib.canvases.Simple():
+                pass
+        assert len(pool.all_figures) == 1
+        assert len(matplotlib.pyplot.get_fignums()) == n_initial
+    assert pool.all_figures == []
+    assert pool.idle_figures == {}
+
+
+def test_figure_pool_output_unchanged(tmpdir):
+    expected = draw_clean_canvas(tmpdir, "pool_test_output_fresh")
+    with mATLASplotlib.canvases.FigurePool():
+        draw_dirty_canvases(tmpdir)
+        pooled = draw_clean_canvas(tmpdir, "pool_test_output_pooled")
+    assert np.array_equal(expected, pooled)
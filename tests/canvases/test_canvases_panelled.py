@@ -112,3 +112,21 @@ def test_panelled_plot_datasets_legends():
         assert len(legend_element.get_texts()) == 4
         texts = [t.get_text() for t in legend_element.get_texts()]
         assert np.array_equal(texts, ["red", "blue", "green", "orange"])
+
+
+def test_panelled_save_applies_limits_once():
+    with mATLASplotlib.canvases.Panelled(n_panels=8) as canvas:
+        n_calls = []
+        apply_axis_limits = canvas._apply_axis_limits
+        canvas._apply_axis_limits = lambda: n_calls.append(1) or apply_axis_limits()
+        for idx in range(8):
+            canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="line", axes="plot{0}".format(idx))
+        canvas.save("blank_test_output", extension="png")
+        assert len(n_calls) == 1
+        canvas.save("blank_test_output", extension="png")
+        assert len(n_calls) == 1
+        canvas.set_axis_range("y_plot3", (0, 20))
+        canvas.save("blank_test_output", extension="png")
+        assert len(n_calls) == 2
+        assert np.allclose(canvas.subplots["plot3"].get_ylim(), (0, 20))
+        os.remove("blank_test_output.png")
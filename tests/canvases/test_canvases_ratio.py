@@ -149,6 +149,32 @@ def test_ratio_save():
         os.remove("blank_test_output.eps")
 
 
+def test_ratio_save_repeated():
+    with mATLASplotlib.canvases.Ratio() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="line")
+        for _ in range(2):
+            canvas.save("blank_test_output", extension="png")
+            assert len(canvas.subplots["bottom"].lines) == 1
+        # The reference line is moved rather than drawn again
+        canvas.set_axis_range("x", (0, 5))
+        canvas.set_axis_tick_ndp("y_ratio", 1)
+        canvas.save("blank_test_output", extension="png")
+        assert len(canvas.subplots["bottom"].lines) == 1
+        assert np.array_equal(canvas.subplots["bottom"].lines[0].get_xdata(), (0, 5))
+        os.remove("blank_test_output.png")
+
+
+def test_ratio_save_log_y_bar():
+    with mATLASplotlib.canvases.Ratio(log_type="y") as canvas:
+        canvas.plot_dataset([1, 2, 3], [0.5, 0.5, 0.5], [10, 100, 999], None, style="bar")
+        canvas.plot_dataset([1, 2, 3], [0.5, 0.5, 0.5], [1, 1.1, 0.9], None, style="scatter", axes="bottom")
+        assert canvas.axis_ranges["y"][0] == 0
+        canvas.save("blank_test_output", extension="png")
+        # The non-positive lower limit is not applied to the log-scale axis
+        assert np.allclose(canvas.subplots["top"].get_ylim(), (10, 1048.95))
+        os.remove("blank_test_output.png")
+
+
 def test_ratio_plot_dataset():
     with mATLASplotlib.canvases.Ratio() as canvas:
         assert canvas.axis_ranges.keys() == ["y_ratio"]
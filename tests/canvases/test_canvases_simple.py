@@ -1,4 +1,5 @@
 import matplotlib
+import matplotlib.image
 import numpy as np
 import os
 import pytest
@@ -152,6 +153,29 @@ def test_simple_save():
         os.remove("blank_test_output.eps")
 
 
+def test_simple_save_multiple_formats():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [5, 10, 12], style="line")
+        canvas.save("blank_test_output", extension=["png", "rgba", "pdf"], dpi=50)
+        # Both raster outputs are drawn from the same finalised figure
+        png_image = matplotlib.image.imread("blank_test_output.png")
+        rgba_image = np.fromfile("blank_test_output.rgba", dtype=np.uint8).reshape(png_image.shape)
+        assert png_image.shape == (300, 300, 4)
+        assert np.array_equal(np.round(png_image * 255).astype(np.uint8), rgba_image)
+        assert os.path.isfile("blank_test_output.pdf")
+        for extension in ["png", "rgba", "pdf"]:
+            os.remove("blank_test_output.{0}".format(extension))
+
+
+def test_simple_save_dpi_per_format():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.save("blank_test_output", extension=["png", "rgba"], dpi={"png": 50, "rgba": 20})
+        assert matplotlib.image.imread("blank_test_output.png").shape == (300, 300, 4)
+        assert os.path.getsize("blank_test_output.rgba") == 120 * 120 * 4
+        for extension in ["png", "rgba"]:
+            os.remove("blank_test_output.{0}".format(extension))
+
+
 def test_simple_save_x_tick_labels():
     with mATLASplotlib.canvases.Simple(x_tick_labels=["A", "B", "C"]) as canvas:
         canvas.save("blank_test_output")
@@ -198,6 +222,57 @@ def test_simple_save_internal_header_fraction_log():
         os.remove("blank_test_output.pdf")
 
 
+def test_simple_save_internal_header_fraction_repeated():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="line")
+        canvas.set_axis_range("y", (0, 12))
+        canvas.internal_header_fraction = 0.4
+        for _ in range(2):
+            canvas.save("blank_test_output", extension="png")
+            assert np.allclose(canvas.subplots["main"].get_ylim(), (0, 20))
+        # Changing the header starts again from the requested range
+        canvas.internal_header_fraction = 0.25
+        canvas.save("blank_test_output", extension="png")
+        assert np.allclose(canvas.subplots["main"].get_ylim(), (0, 16))
+        os.remove("blank_test_output.png")
+
+
+def test_simple_save_skips_unchanged_stages():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="line")
+        canvas.save("blank_test_output", extension="png")
+        # Changes made directly to the axes are kept if nothing has been requested since the last save
+        canvas.subplots["main"].set_ylim(1, 2)
+        canvas.save("blank_test_output", extension="png")
+        assert np.allclose(canvas.subplots["main"].get_ylim(), (1, 2))
+        canvas.set_axis_range("y", (0, 20))
+        canvas.save("blank_test_output", extension="png")
+        assert np.allclose(canvas.subplots["main"].get_ylim(), (0, 20))
+        os.remove("blank_test_output.png")
+
+
+def test_simple_save_reuses_finalised_figure():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="line")
+        canvas.save("blank_test_output", extension="png")
+        n_calls = []
+        get_finalisation_inputs = canvas._get_finalisation_inputs
+        canvas._get_finalisation_inputs = lambda: n_calls.append(1) or get_finalisation_inputs()
+        version = canvas.state_version
+        canvas.save("blank_test_output", extension="png")
+        assert not n_calls
+        assert canvas.state_version == version
+        # Modifications through attributes and methods are both noticed
+        canvas.internal_header_fraction = 0.2
+        assert canvas.state_version > version
+        canvas.save("blank_test_output", extension="png")
+        assert n_calls
+        version = canvas.state_version
+        canvas.set_axis_tick_ndp("x", 2)
+        assert canvas.state_version > version
+        os.remove("blank_test_output.png")
+
+
 def test_simple_plot_dataset():
     with mATLASplotlib.canvases.Simple() as canvas:
         assert canvas.axis_ranges.keys() == []
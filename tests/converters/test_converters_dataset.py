@@ -138,3 +138,95 @@ def test_dataset_construct_2D_bin_list_invalid():
     ds = Dataset([1, 2, 3], [4, 9, 16])
     with pytest.raises(ValueError):
         ds.construct_2D_bin_list("yz")
+
+
+def test_dataset_derived_quantities():
+    ds = Dataset(np.array([4, 5, 6]), [(1, 2), (2, 3), (3, 4)], [4, 9, 16], [(3, 2), (2, 1), (1, 0)])
+    assert ds.x_points.dtype == np.float64
+    assert np.array_equal(ds.x_bin_low_edges, np.array([3, 3, 3]))
+    assert np.array_equal(ds.x_bin_high_edges, np.array([6, 8, 10]))
+    assert np.array_equal(ds.x_bin_widths, np.array([3, 5, 7]))
+    assert np.array_equal(ds.x_points_error_symmetrised, np.array([4.5, 5.5, 6.5]))
+    assert np.array_equal(ds.x_errors_symmetrised, np.array([1.5, 2.5, 3.5]))
+    assert np.array_equal(ds.y_errors_symmetrised, np.array([2.5, 1.5, 0.5]))
+
+
+def test_dataset_lazy_attributes():
+    ds = Dataset([1, 2, 3], [0.5, 0.5, 0.5], [4, 9, 16], None)
+    assert "band_edges_x" not in ds._cache
+    assert np.array_equal(ds.band_edges_x, np.array([0.5, 1.5, 1.5, 2.5, 2.5, 3.5]))
+    assert "band_edges_x" in ds._cache
+    assert ds.x_bin_edges is ds.x_bin_edges
+    ds.invalidate_cache()
+    assert "band_edges_x" not in ds._cache
+    assert not hasattr(ds, "z_points")
+    with pytest.raises(AttributeError):
+        ds.x_not_an_attribute
+
+
+def test_dataset_read_only_attributes():
+    ds = Dataset([1, 2, 3], [(0.5, 1)] * 3, [4, 9, 16], None)
+    for name in ["x_points", "x_error_pairs", "x_points_error_symmetrised", "x_errors_symmetrised", "y_points", "y_error_pairs", "band_edges_x"]:
+        with pytest.raises(ValueError):
+            getattr(ds, name)[0] = 100
+    assert np.array_equal(ds._data["x"], np.array([[1, 2, 3], [0.5, 0.5, 0.5], [1, 1, 1]]))
+    # Copies can still be modified
+    points = ds.y_points.copy()
+    points[0] = 100
+    assert ds.y_points[0] == 4
+
+
+def test_dataset_edges():
+    x, y = np.arange(1000, dtype=float), np.random.uniform(size=1000)
+    ds = Dataset(x, [(0.5, 0.25)] * 1000, y, [(1, 2)] * 1000)
+    # Compare with building each list one bin at a time
+    assert np.array_equal(ds.x_all_bin_edges, [edge for _x in x for edge in (_x - 0.5, _x + 0.25)])
+    assert np.array_equal(ds.band_edges_x, [edge for _x in x for edge in (_x - 0.5, _x + 0.25)])
+    assert np.array_equal(ds.y_at_x_bin_edges, [_y for _y in y for _ in range(2)])
+    assert np.array_equal(ds.x_at_y_bin_edges, [_x for _x in x for _ in range(2)])
+    assert np.array_equal(ds.band_edges_y_low, [_y - 1 for _y in y for _ in range(2)])
+    assert np.array_equal(ds.band_edges_y_high, [_y + 2 for _y in y for _ in range(2)])
+
+
+def test_dataset_remove_zeros():
+    ds = Dataset([1, 2, 3, 4], [(1, 2)] * 4, [4, 0, 16, 0], [1, 2, 3, 4], remove_zeros=True)
+    assert np.array_equal(ds.x_points, np.array([1, 3]))
+    assert np.array_equal(ds.x_error_pairs, np.array([(1, 2), (1, 2)]))
+    assert np.array_equal(ds.y_points, np.array([4, 16]))
+    assert np.array_equal(ds.y_error_pairs, np.array([(1, 1), (3, 3)]))
+    assert ds.nPoints == 2
+
+
+def test_dataset_remove_zeros_invalid_shape():
+    with pytest.raises(ValueError):
+        Dataset([1, 2], [3, 4], [3, 0, 6, 8], remove_zeros=True)
+    with pytest.raises(ValueError):
+        Dataset(x_values=[1, 0, 3], remove_zeros=True)
+
+
+def test_dataset_apply_mask():
+    ds = Dataset([1, 2, 3], [4, 9, 16])
+    assert np.array_equal(ds.band_edges_x, np.array([1, 1, 2, 2, 3, 3]))
+    ds.apply_mask([True, False, True])
+    assert np.array_equal(ds.band_edges_x, np.array([1, 1, 3, 3]))
+    assert np.array_equal(ds.y_points, np.array([4, 16]))
+    assert ds.nPoints == 2
+    with pytest.raises(ValueError):
+        ds.apply_mask([True])
+    with pytest.raises(ValueError):
+        Dataset([2, 3], [4, 9], [8, 18, 12, 27]).apply_mask([True] * 4)
+
+
+def test_dataset_remove_non_finite():
+    ds = Dataset([1, 2, 3, 4], None, [4, np.nan, 16, 25], [1, 1, np.inf, 1])
+    ds.remove_non_finite()
+    assert np.array_equal(ds.x_points, np.array([1, 4]))
+    assert np.array_equal(ds.y_points, np.array([4, 25]))
+
+
+def test_dataset_restrict_range():
+    ds = Dataset([1, 2, 3, 4], [4, 9, 16, 25])
+    ds.restrict_range("x", minimum=2)
+    assert np.array_equal(ds.x_points, np.array([2, 3, 4]))
+    ds.restrict_range("y", maximum=16)
+    assert np.array_equal(ds.y_points, np.array([9, 16]))
@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 import ROOT
 import mATLASplotlib
+from mATLASplotlib.converters.root2data import _sample_adaptively
 
 def test_root2data_constructor_TF1():
     root_object = ROOT.TF1("TF1", "sin(x)/x", 0.0, 10.0)
@@ -116,6 +117,32 @@ def test_root2data_constructor_TH2D():
     assert ds.nPoints == 9
 
 
+def test_root2data_constructor_profiles():
+    for root_object in [ROOT.TProfile("TProfile", "TProfile", 3, -0.5, 2.5),
+                        ROOT.TProfile2D("TProfile2D", "TProfile2D", 3, -0.5, 2.5, 3, -0.5, 2.5),
+                        ROOT.TProfile3D("TProfile3D", "TProfile3D", 3, -0.5, 2.5, 3, -0.5, 2.5, 3, -0.5, 2.5)]:
+        for _x in range(3):
+            for value in [1.0, 3.0]:
+                root_object.Fill(*([_x] * root_object.GetDimension() + [value]))
+        ds = mATLASplotlib.converters.Dataset(root_object)
+        # Profiles store sums of weighted values, so the contents should be the means from GetBinContent
+        if isinstance(root_object, ROOT.TH2):
+            assert np.array_equal(ds.z_points, [root_object.GetBinContent(ix, iy) for iy in range(1, 4) for ix in range(1, 4)])
+            assert np.array_equal(ds.z_points, [2.0, 0, 0, 0, 2.0, 0, 0, 0, 2.0])
+        else:
+            assert np.array_equal(ds.y_points, [root_object.GetBinContent(_bin) for _bin in range(1, 4)])
+        if isinstance(root_object, ROOT.TProfile):
+            assert np.array_equal(ds.y_points, [2.0, 2.0, 2.0])
+
+
+def test_root2data_constructor_TH1K():
+    root_object = ROOT.TH1K("TH1K", "TH1K", 3, -0.5, 2.5)
+    for _x in [0, 1, 1, 2]:
+        root_object.Fill(_x)
+    ds = mATLASplotlib.converters.Dataset(root_object)
+    assert np.array_equal(ds.y_points, [root_object.GetBinContent(_bin) for _bin in range(1, 4)])
+
+
 def test_root2data_constructor_TObject():
     with pytest.raises(ValueError):
         root_object = ROOT.TObject()
@@ -138,3 +165,83 @@ def test_root2data_zero_removal():
     assert np.array_equal(ds.x_error_pairs, np.array([(0.0, 0.0), (0.0, 0.0)]))
     assert np.array_equal(ds.y_error_pairs, np.array([(0.0, 0.0), (0.0, 0.0)]))
     assert ds.nPoints == 2
+
+
+def test_root2data_constructor_TH1F_variable_bins():
+    root_object = ROOT.TH1F("TH1F", "TH1F", 3, array.array("d", [0.0, 1.0, 3.0, 6.0]))
+    root_object.Sumw2()
+    for _x, _w in zip([0.5, 2.0, 4.0], [1.0, 2.0, 3.0]):
+        root_object.Fill(_x, _w)
+    ds = mATLASplotlib.converters.Dataset(root_object)
+    assert np.array_equal(ds.x_points, np.array([0.5, 2.0, 4.5]))
+    assert np.array_equal(ds.x_error_pairs, np.array([(0.5, 0.5), (1.0, 1.0), (1.5, 1.5)]))
+    assert np.array_equal(ds.y_points, np.array([1.0, 2.0, 3.0]))
+    assert np.allclose(ds.y_error_pairs, np.array([(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]))
+
+
+def test_root2data_constructor_TH1D_poisson_errors():
+    root_object = ROOT.TH1D("TH1D_poisson", "TH1D_poisson", 3, -0.5, 2.5)
+    root_object.SetBinErrorOption(ROOT.TH1.kPoisson)
+    for _x in range(3):
+        root_object.Fill(_x)
+    ds = mATLASplotlib.converters.Dataset(root_object)
+    assert np.array_equal(ds.y_points, np.array([1.0, 1.0, 1.0]))
+    assert np.allclose(ds.y_error_pairs, np.array([(root_object.GetBinErrorLow(_bin), root_object.GetBinErrorUp(_bin)) for _bin in range(1, 4)]))
+
+
+def test_root2data_constructor_TH2D_ordering():
+    root_object = ROOT.TH2D("TH2D_ordering", "TH2D_ordering", 3, -0.5, 2.5, 2, -0.5, 1.5)
+    for _x in range(3):
+        for _y in range(2):
+            root_object.Fill(_x, _y, 10 * _y + _x)
+    ds = mATLASplotlib.converters.Dataset(root_object)
+    assert np.array_equal(ds.z_points, np.array([0.0, 1.0, 2.0, 10.0, 11.0, 12.0]))
+    assert ds.nPoints == 6
+
+
+def test_root2data_TGraph_copy():
+    x, y = [0, 1, 2], [0, 1, 4]
+    root_object = ROOT.TGraph(3, array.array("d", x), array.array("d", y))
+    view = mATLASplotlib.converters.root2data(root_object)
+    owned = mATLASplotlib.converters.root2data(root_object, copy=True)
+    root_object.SetPoint(0, 5.0, 7.0)
+    assert np.array_equal(view.x_values, np.array([5.0, 1.0, 2.0]))
+    assert np.array_equal(owned.x_values, np.array([0.0, 1.0, 2.0]))
+    assert np.array_equal(owned.y_values, np.array([0.0, 1.0, 4.0]))
+
+
+def test_root2data_constructor_TF1_n_samples():
+    root_object = ROOT.TF1("TF1_n_samples", "sin(x)/x", 0.0, 10.0)
+    ds = mATLASplotlib.converters.Dataset(root_object, n_samples=50)
+    assert np.array_equal(ds.x_points, np.linspace(0.0, 10.0, num=50, endpoint=True))
+    assert np.allclose(ds.y_points, [root_object.Eval(_x) for _x in ds.x_points])
+
+
+def test_root2data_constructor_TF1_adaptive_sampling():
+    root_object = ROOT.TF1("TF1_adaptive", "exp(-x*x/0.02)", -5.0, 5.0)
+    ds = mATLASplotlib.converters.Dataset(root_object, n_samples=300, adaptive_sampling=True)
+    # Samples should be sorted, within budget and concentrated around the peak
+    assert ds.nPoints <= 300
+    assert np.all(np.diff(ds.x_points) > 0)
+    assert np.sum(np.abs(ds.x_points) < 0.5) > ds.nPoints / 2
+    assert np.allclose(ds.y_points, [root_object.Eval(_x) for _x in ds.x_points])
+
+
+def test_root2data_adaptive_sampling_evaluations():
+    evaluated = []
+
+    def step(x_values):
+        evaluated.extend(x_values)
+        return np.where(x_values > 0.3, 1.0, 0.0)
+    x_values, y_values = _sample_adaptively(step, 0.0, 1.0, 1000)
+    # Only the midpoints of intervals which are still being refined are evaluated, so each sample costs a few evaluations
+    assert len(evaluated) < 3 * 1000
+    assert len(x_values) == 1000
+    assert np.all(np.diff(x_values) >= 0)
+    assert np.array_equal(y_values, step(x_values))
+
+
+def test_root2data_canvas_plot_TF1_adaptive_sampling():
+    root_object = ROOT.TF1("TF1_canvas_adaptive", "sin(x)/x", 0.0, 10.0)
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(root_object, style="line", colour="red", n_samples=100, adaptive_sampling=True)
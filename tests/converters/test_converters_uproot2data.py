@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import mATLASplotlib
+
+uproot = pytest.importorskip("uproot")
+
+
+def write_and_read(tmpdir, name, histogram):
+    file_name = str(tmpdir.join("{0}.root".format(name)))
+    output_file = uproot.recreate(file_name)
+    output_file[name] = histogram
+    output_file.close()
+    return uproot.open(file_name)[name]
+
+
+def test_uproot2data_constructor_TH1(tmpdir):
+    contents, edges = np.array([1.0, 4.0, 0.0, 9.0]), np.array([0.0, 1.0, 3.0, 4.0, 8.0])
+    histogram = write_and_read(tmpdir, "TH1", (contents, edges))
+    ds = mATLASplotlib.converters.Dataset(histogram)
+    assert ds.get_dimensions() == ["x", "y"]
+    assert np.array_equal(ds.x_points, [0.5, 2.0, 3.5, 6.0])
+    assert np.array_equal(ds.x_bin_edges, edges)
+    assert np.array_equal(ds.y_points, contents)
+    # Errors should be taken from the stored sum of squared weights
+    errors = np.sqrt(histogram.variances() if callable(histogram.variances) else histogram.variances)
+    assert np.allclose(ds.y_error_pairs, np.column_stack((errors, errors)))
+    assert ds.nPoints == 4
+
+
+def test_uproot2data_constructor_TH1_remove_zeros(tmpdir):
+    contents, edges = np.array([1.0, 4.0, 0.0, 9.0]), np.array([0.0, 1.0, 3.0, 4.0, 8.0])
+    ds = mATLASplotlib.converters.Dataset(write_and_read(tmpdir, "TH1", (contents, edges)), remove_zeros=True)
+    assert np.array_equal(ds.x_points, [0.5, 2.0, 6.0])
+    assert np.array_equal(ds.y_points, [1.0, 4.0, 9.0])
+    assert ds.nPoints == 3
+
+
+def test_uproot2data_constructor_TH2(tmpdir):
+    contents, x_edges, y_edges = np.arange(6.0).reshape(3, 2), np.array([0.0, 1.0, 2.0, 4.0]), np.array([0.0, 10.0, 20.0])
+    ds = mATLASplotlib.converters.Dataset(write_and_read(tmpdir, "TH2", (contents, x_edges, y_edges)))
+    assert ds.get_dimensions() == ["x", "y", "z"]
+    assert np.array_equal(ds.x_points, [0.5, 1.5, 3.0])
+    assert np.array_equal(ds.y_points, [5.0, 15.0])
+    # As for ROOT input, z values should have x varying fastest
+    assert np.array_equal(ds.z_points, [0.0, 2.0, 4.0, 1.0, 3.0, 5.0])
+    assert ds.nPoints == 6
+
+
+def test_uproot2data_invalid_input():
+    assert not mATLASplotlib.converters.uproot2data.valid_input(np.zeros(3))
+    with pytest.raises(AssertionError):
+        mATLASplotlib.converters.Dataset(np.zeros(3))
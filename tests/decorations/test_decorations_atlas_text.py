@@ -19,9 +19,8 @@ def test_atlas_text_internal():
         initial_text_elements = [child for child in canvas.subplots["main"].get_children() if isinstance(child, matplotlib.text.Text)]
         canvas.add_ATLAS_label(0.5, 0.5, plot_type="Internal", anchor_to="lower left")
         final_text_elements = [child for child in canvas.subplots["main"].get_children() if isinstance(child, matplotlib.text.Text)]
-        # "ATLAS Internal" label consists of three elements: ATLASI (invisible), ATLAS and Internal
-        assert len(final_text_elements) - len(initial_text_elements) == 3
-        assert len([t for t in final_text_elements if t.get_text() == "ATLASI"]) == 1
+        # "ATLAS Internal" label consists of two elements: ATLAS and Internal
+        assert len(final_text_elements) - len(initial_text_elements) == 2
         assert len([t for t in final_text_elements if t.get_text() == "ATLAS"]) == 1
         assert len([t for t in final_text_elements if t.get_text() == "Internal"]) == 1
 
@@ -78,9 +77,10 @@ def test_atlas_text_incorrect_alignment():
 
 def test_atlas_text_renderer():
     if hasattr(matplotlib.backends, "backend_agg"):
+        original_backend = matplotlib.get_backend()
         matplotlib.pyplot.switch_backend("agg")
         with mATLASplotlib.canvases.Simple() as canvas:
             canvas.plot_dataset([0, 1], [5, 10], style="scatter")
             canvas.add_ATLAS_label(0.5, 0.5, plot_type="Internal", anchor_to="upper right")
-        matplotlib.pyplot.switch_backend("pdf")
+        matplotlib.pyplot.switch_backend(original_backend)
 
@@ -0,0 +1,36 @@
+import matplotlib
+from matplotlib.font_manager import FontProperties
+import mATLASplotlib
+from mATLASplotlib.decorations import get_text_extent
+from mATLASplotlib.caching import BoundedCache
+
+
+def test_text_metrics_matches_drawn_text():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        for text in ["ATLAS", r"$\sqrt{s}$ = 13 TeV"]:
+            drawn_text = canvas.subplots["main"].text(0.5, 0.5, text, fontsize=17, style="italic")
+            renderer = canvas.figure.canvas.get_renderer()
+            width, height, _ = get_text_extent(text, FontProperties(size=17, style="italic"), canvas.figure.dpi)
+            assert width == drawn_text.get_window_extent(renderer).width
+
+
+def test_text_metrics_cached():
+    font_properties = FontProperties(size=12)
+    extent = get_text_extent("Internal", font_properties, 100)
+    assert get_text_extent("Internal", font_properties, 100) is extent
+    # Changing the font or the resolution changes the extent
+    assert get_text_extent("Internal", FontProperties(size=24), 100)[0] > extent[0]
+    assert get_text_extent("Internal", font_properties, 200)[0] > extent[0]
+    font_properties.set_size(24)
+    assert get_text_extent("Internal", FontProperties(size=12), 100) is extent
+
+
+def test_text_metrics_cache_bounded():
+    font_properties = FontProperties(size=12)
+    extent = get_text_extent("Internal", font_properties, 100)
+    for idx in range(BoundedCache.default_max_size):
+        get_text_extent(str(idx), font_properties, 100)
+    # The cache has been cleared since the first measurement, which is therefore repeated
+    repeated_extent = get_text_extent("Internal", font_properties, 100)
+    assert repeated_extent is not extent
+    assert repeated_extent == extent
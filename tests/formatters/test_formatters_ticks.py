@@ -0,0 +1,55 @@
+import os
+import numpy as np
+import pytest
+import mATLASplotlib
+from mATLASplotlib.formatters import get_auto_ticks, LogMinorLocator
+
+
+def test_ticks_log_minor_visible_decades():
+    ticks = LogMinorLocator().tick_values(0.5, 50)
+    assert len(ticks) == 24
+    assert np.allclose(ticks[:8], [0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+    assert np.allclose(ticks[-8:], [20, 30, 40, 50, 60, 70, 80, 90])
+    # The same visible ticks as a fixed list of every minor tick
+    all_ticks = np.array([10**x * val for x in range(-100, 100) for val in [2, 3, 4, 5, 6, 7, 8, 9]])
+    visible_ticks = ticks[(ticks >= 0.5) & (ticks <= 50)]
+    assert np.array_equal(visible_ticks, all_ticks[(all_ticks >= 0.5) & (all_ticks <= 50)])
+
+
+def test_ticks_log_minor_cached():
+    ticks = LogMinorLocator(subs=[2, 5]).tick_values(1e-3, 1e3)
+    assert LogMinorLocator(subs=[2, 5]).tick_values(1e-3, 1e3) is ticks
+    assert len(ticks) == 14
+    with pytest.raises(ValueError):
+        ticks[0] = 1
+
+
+def test_ticks_log_minor_invalid_range():
+    with pytest.raises(ValueError):
+        LogMinorLocator().tick_values(0, 10)
+
+
+def test_ticks_log_minor_canvas():
+    with mATLASplotlib.canvases.Simple(log_type="y") as canvas:
+        canvas.plot_dataset([1, 2, 3], [0.5, 0.5, 0.5], [5, 100, 2000], None, style="line")
+        canvas.save("blank_test_output", extension="png")
+        assert isinstance(canvas.subplots["main"].yaxis.get_minor_locator(), LogMinorLocator)
+        ticks = canvas.subplots["main"].yaxis.get_minor_locator()()
+        assert min(ticks) >= 2 and max(ticks) <= 9000
+        os.remove("blank_test_output.png")
+
+
+def test_ticks_auto():
+    intervals = mATLASplotlib.canvases.base_canvas.BaseCanvas.auto_tick_intervals
+    for axis_range in [(0.5, 1.5), (0.9, 1.1), (0.0, 2.0), (0.75, 1.25)]:
+        # Compare with choosing the interval and removing the topmost tick one tick at a time
+        interval = 0.99 * abs(axis_range[1] - axis_range[0])
+        tick_size = min(intervals, key=lambda x: abs((interval / x) - 4))
+        expected = [t for t in np.arange(1.0 - 10 * tick_size, 1.0 + 10 * tick_size, tick_size) if not np.allclose(t, axis_range[1])]
+        assert np.array_equal(get_auto_ticks(axis_range, intervals), expected)
+
+
+def test_ticks_auto_copy():
+    ticks = get_auto_ticks((0.5, 1.5), [0.1, 0.2, 0.5])
+    ticks.append(100)
+    assert 100 not in get_auto_ticks((0.5, 1.5), [0.1, 0.2, 0.5])
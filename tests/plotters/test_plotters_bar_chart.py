@@ -38,3 +38,30 @@ def test_bar_chart_label():
         canvas.plot_dataset([0, 1], [0.5, 0.5], [5, 10], None, style="bar", label="Testing")
         labels = [c.get_label() for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.patches.Rectangle)]
         assert "Testing" in labels
+
+
+def test_bar_chart_stepped():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(np.arange(1000), np.full(1000, 0.5), np.arange(1000) % 7, None, style="stepped bar", colour="red", edgecolour="black", edgewidth=2, label="Testing")
+        axes = canvas.subplots["main"]
+        fills = [c for c in axes.collections if isinstance(c, matplotlib.collections.PolyCollection)]
+        assert len(fills) == 1
+        assert np.array_equal(fills[0].get_facecolor(), [[1, 0, 0, 1]])
+        assert len(axes.lines) == 1
+        x_outline, y_outline = axes.lines[0].get_data()
+        assert (x_outline[0], y_outline[0]) == (-0.5, 0)
+        assert (x_outline[-1], y_outline[-1]) == (999.5, 0)
+        assert y_outline.max() == 6
+        assert axes.lines[0].get_linewidth() == 2
+        assert axes.get_ylim()[0] == 0
+        # Only the legend proxy remains as a patch
+        assert len(axes.patches) == 1
+        assert "Testing" in axes.get_legend_handles_labels()[1]
+
+
+def test_bar_chart_stepped_linewidth():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="stepped bar", colour="red")
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [5, 10, 12], None, style="stepped bar", colour="blue", linewidth=3)
+        fills = [c for c in canvas.subplots["main"].collections if isinstance(c, matplotlib.collections.PolyCollection)]
+        assert [fill.get_linewidth()[0] for fill in fills] == [0, 3]
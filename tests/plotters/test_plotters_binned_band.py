@@ -100,3 +100,24 @@ def test_binned_band_central_line_stepped_label():
         canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [2, 3, 4], [1, 1, 1], style="binned band central line stepped", label="Testing")
         proxy = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.patches.Ellipse)][0]
         assert proxy.get_label() == "Testing"
+
+
+def test_binned_band_many_bins():
+    n_bins = 100000
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(np.arange(n_bins), [0.5] * n_bins, np.ones(n_bins), [0.1] * n_bins, style="binned band central line stepped")
+        band = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.collections.PolyCollection)][0]
+        central_line = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.lines.Line2D)][0]
+        assert len(central_line.get_xdata()) == 2 * n_bins
+        assert band.get_paths()[0].vertices.shape[0] > 4 * n_bins
+
+
+def test_binned_band_rasterize():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [4, 9, 16], [2, 3, 4], style="binned band central line", rasterize=True, label="Testing")
+        band = [c for c in canvas.subplots["main"].collections if isinstance(c, matplotlib.collections.PolyCollection)][0]
+        assert band.get_rasterized()
+        assert all(line.get_rasterized() for line in canvas.subplots["main"].lines)
+        # The legend proxy stays as a vector
+        proxy = [c for c in canvas.subplots["main"].patches if isinstance(c, matplotlib.patches.Ellipse)][0]
+        assert not proxy.get_rasterized()
@@ -37,3 +37,44 @@ def test_coloured_2D_with_key():
         assert len(axes) == 1
         assert np.array_equal(canvas.subplots["main"].get_xlim(), (0.5, 4.5))
         assert np.array_equal(canvas.subplots["main"].get_ylim(), (0.5, 4.5))
+
+
+def test_coloured_2D_uniform_image():
+    x, ex = [1, 2, 3], [0.5, 0.5, 0.5]
+    y, ey = [10, 20], [5, 5]
+    z = [1, 2, 3, 4, 5, 6]
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, ex, y, ey, z, None, style="coloured 2D")
+        images = canvas.subplots["main"].images
+        assert len(images) == 1
+        # Rows are y bins and columns are x bins, with x varying fastest in the input
+        assert np.array_equal(images[0].get_array(), [[1, 2, 3], [4, 5, 6]])
+        assert np.array_equal(canvas.subplots["main"].get_xlim(), (0.5, 3.5))
+        assert np.array_equal(canvas.subplots["main"].get_ylim(), (5, 25))
+
+
+def test_coloured_2D_mesh():
+    x, ex = [0.5, 1.5, 4.5], [0.5, 0.5, 0.5]
+    y, ey = [10, 20], [5, 5]
+    z = [1, 2, 3, 4, 5, 6]
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, ex, y, ey, z, None, style="coloured 2D")
+        meshes = [c for c in canvas.subplots["main"].collections if isinstance(c, matplotlib.collections.QuadMesh)]
+        assert len(meshes) == 1
+        assert not canvas.subplots["main"].images
+        # The gap between x=2 and x=4 is drawn as zero
+        assert np.array_equal(meshes[0].get_array(), [1, 2, 0, 3, 4, 5, 0, 6])
+        assert np.array_equal(canvas.subplots["main"].get_xlim(), (0, 5))
+        assert np.array_equal(canvas.subplots["main"].get_ylim(), (5, 25))
+
+
+def test_coloured_2D_as_image():
+    x, ex = [1, 2, 3], [0.5, 0.5, 0.5]
+    y, ey = [10, 20], [5, 5]
+    z = [1, 2, 3, 4, 5, 6]
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, ex, y, ey, z, None, style="coloured 2D", as_image=False)
+        meshes = [c for c in canvas.subplots["main"].collections if isinstance(c, matplotlib.collections.QuadMesh)]
+        assert len(meshes) == 1
+        assert not canvas.subplots["main"].images
+        assert np.array_equal(meshes[0].get_array(), [1, 2, 3, 4, 5, 6])
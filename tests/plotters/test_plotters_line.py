@@ -1,4 +1,5 @@
 import matplotlib
+import matplotlib.image
 import numpy as np
 import mATLASplotlib
 
@@ -66,3 +67,82 @@ def test_line_stepped():
         canvas.plot_dataset([0, 1, 2, 3], [0.5, 0.5, 0.5, 0.5], [5, 10, 12, 13], None, style="stepped line")
         line = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.lines.Line2D)][0]
         assert line.get_drawstyle() == "steps-pre"
+
+
+def test_line_rasterize():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2, 3], [5, 10, 12, 13], style="line", rasterize=True)
+        assert canvas.subplots["main"].lines[0].get_rasterized()
+
+
+def test_line_decimate():
+    x = np.linspace(0, 10, 100000)
+    y = np.sin(x) + np.random.normal(scale=0.1, size=len(x))
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, y, style="line", decimate=100)
+        _x, _y = canvas.subplots["main"].lines[0].get_data()
+        assert len(_x) <= 4 * 100
+        # M4 keeps the extreme points and the ends of the line
+        assert (min(_y), max(_y)) == (min(y), max(y))
+        assert (_x[0], _x[-1]) == (0, 10)
+        assert np.all(np.diff(_x) >= 0)
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, y, style="line", decimate=True)
+        line = canvas.subplots["main"].lines[0]
+        assert isinstance(line, mATLASplotlib.plotters.line.DecimatedLine)
+        assert len(line.get_xdata()) == len(x)
+        n_columns = line.columns_per_pixel * (np.ceil(canvas.subplots["main"].bbox.width) + 2)
+        assert len(line.get_decimated_indices()) <= 4 * n_columns
+        # Only the visible points and their neighbours are drawn after zooming in
+        canvas.subplots["main"].set_xlim(2, 3)
+        kept = line.get_decimated_indices()
+        pixel_width = 1.0 / canvas.subplots["main"].bbox.width
+        assert np.all((x[kept] >= 2 - 2 * pixel_width) & (x[kept] <= 3 + 2 * pixel_width))
+        assert x[kept[0]] < 2 and x[kept[-1]] > 3
+
+
+def test_line_decimate_automatic():
+    x = np.linspace(0, 10, mATLASplotlib.plotters.line.Line.decimation_threshold + 1)
+    for kwargs, is_decimated in [({}, True), ({"decimate": False}, False), ({"marker": "o"}, False)]:
+        with mATLASplotlib.canvases.Simple() as canvas:
+            canvas.plot_dataset(x, np.sin(x), style="line", **kwargs)
+            assert isinstance(canvas.subplots["main"].lines[0], mATLASplotlib.plotters.line.DecimatedLine) == is_decimated
+
+
+def _decimated_images(tmpdir, x, y, log_type="", x_range=None):
+    images = []
+    for decimate in [False, True]:
+        with mATLASplotlib.canvases.Simple(log_type=log_type) as canvas:
+            canvas.plot_dataset(x, y, style="line", linewidth=1, decimate=decimate)
+            if x_range is not None:
+                canvas.set_axis_range("x", x_range)
+            output_name = str(tmpdir.join("decimate_{0}".format(decimate)))
+            canvas.save(output_name, "png")
+        images.append(matplotlib.image.imread(output_name + ".png"))
+    return images
+
+
+def test_line_decimate_pixel_identical(tmpdir):
+    x = np.linspace(0, 10, 200000)
+    images = _decimated_images(tmpdir, x, np.sin(x) + np.random.normal(scale=0.1, size=len(x)))
+    # Antialiasing means that a few pixels can differ slightly
+    assert np.mean(np.abs(images[0] - images[1]) > 0.1) < 0.01
+
+
+def test_line_decimate_pixel_identical_log_x(tmpdir):
+    x = np.logspace(0, 3, 200000)
+    images = _decimated_images(tmpdir, x, np.sin(x) + np.random.normal(scale=0.1, size=len(x)), log_type="x", x_range=(1, 1000))
+    assert np.mean(np.abs(images[0] - images[1]) > 0.1) < 0.01
+
+
+def test_line_decimate_pixel_identical_zoomed(tmpdir):
+    x = np.linspace(0, 1000, 200000)
+    images = _decimated_images(tmpdir, x, np.sin(x) + np.random.normal(scale=0.1, size=len(x)), x_range=(0, 10))
+    assert np.mean(np.abs(images[0] - images[1]) > 0.1) < 0.01
+
+
+def test_line_decimate_unsorted():
+    x = np.random.uniform(size=10000)
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset(x, x, style="line", decimate=10)
+        assert len(canvas.subplots["main"].lines[0].get_xdata()) == 10000
@@ -1,3 +1,4 @@
+import os
 import matplotlib
 import numpy as np
 import mATLASplotlib
@@ -91,3 +92,17 @@ def test_scatter_yerror_with_error_bar_caps():
     with mATLASplotlib.canvases.Simple() as canvas:
         canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [4, 9, 16], [2, 3, 4], style="scatter yerror", with_error_bar_caps=True)
         assert len(canvas.subplots["main"].get_children()) == n_children_no_caps + 2
+
+
+def test_scatter_rasterize(tmpdir):
+    x = np.linspace(0, 1, 20000)
+    output_sizes = []
+    for rasterize in [False, True]:
+        with mATLASplotlib.canvases.Simple() as canvas:
+            canvas.plot_dataset(x, np.full(len(x), 0.1), x, np.full(len(x), 0.1), style="scatter yerror", rasterize=rasterize, label="Testing")
+            assert all(c.get_rasterized() == rasterize for c in canvas.subplots["main"].lines + canvas.subplots["main"].collections)
+            canvas.add_legend(0.2, 0.8)
+            output_name = str(tmpdir.join("rasterize_{0}".format(rasterize)))
+            canvas.save(output_name)
+            output_sizes.append(os.path.getsize(output_name + ".pdf"))
+    assert output_sizes[1] < output_sizes[0] / 10
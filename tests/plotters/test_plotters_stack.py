@@ -1,5 +1,6 @@
 import matplotlib
 import numpy as np
+import pytest
 import mATLASplotlib
 
 def test_stack_constructor():
@@ -58,3 +59,45 @@ def test_stack_outlinewidth():
         bars = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.patches.Rectangle)]
         assert bars[0].get_linewidth() == 20
 
+
+def test_stack_bottom_array():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [2, 3, 4], [1, 1, 1], style="stack")
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [4, 9, 16], [2, 3, 4], style="stack")
+        assert isinstance(canvas.subplots["main"].stack_bottom, np.ndarray)
+        assert np.array_equal(canvas.subplots["main"].stack_bottom, [6, 12, 20])
+
+
+def test_stack_mismatched_bins():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [2, 3, 4], None, style="stack")
+        with pytest.raises(ValueError):
+            canvas.plot_dataset([0, 1], [0.5, 0.5], [4, 9], None, style="stack")
+
+
+def test_stack_stepped():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        for _ in range(20):
+            canvas.plot_dataset(np.arange(500), np.full(500, 0.5), np.ones(500), None, style="stepped stack", colour="blue")
+        assert not canvas.subplots["main"].patches
+        layers = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.collections.PolyCollection)]
+        assert len(layers) == 20
+        # The top layer should lie between heights 19 and 20
+        vertices = layers[-1].get_paths()[0].vertices
+        assert vertices[:, 0].min() == -0.5
+        assert vertices[:, 0].max() == 499.5
+        assert vertices[:, 1].min() == 19
+        assert vertices[:, 1].max() == 20
+        assert np.array_equal(layers[-1].get_facecolor(), [[0, 0, 1, 1]])
+        # As for bars, the y-axis should start at the base of the stack
+        assert canvas.subplots["main"].get_ylim()[0] == 0
+
+
+def test_stack_stepped_hatchcolour():
+    with mATLASplotlib.canvases.Simple() as canvas:
+        canvas.plot_dataset([0, 1, 2], [0.5, 0.5, 0.5], [2, 3, 4], [1, 1, 1], style="stepped stack", colour="blue", hatch="x", hatchcolour="#00ff00", label="Testing")
+        layer = [c for c in canvas.subplots["main"].get_children() if isinstance(c, matplotlib.collections.PolyCollection)][0]
+        assert layer.get_hatch() == "x"
+        assert np.array_equal(layer.get_facecolor(), [[0, 0, 1, 1]])
+        assert np.array_equal(layer.get_edgecolor(), [[0, 1, 0, 1]])
+        assert "Testing" in canvas.subplots["main"].get_legend_handles_labels()[1]
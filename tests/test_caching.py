@@ -0,0 +1,19 @@
+from mATLASplotlib.caching import BoundedCache
+
+
+def test_caching_bounded():
+    cache = BoundedCache(max_size=3)
+    for key in range(3):
+        cache[key] = str(key)
+    assert cache == {0: "0", 1: "1", 2: "2"}
+    # Replacing an existing key does not clear the cache
+    cache[2] = "two"
+    assert len(cache) == 3
+    # Adding a new key to a full cache clears it first
+    cache[3] = "3"
+    assert cache == {3: "3"}
+    assert cache.get(0, None) is None
+
+
+def test_caching_default_size():
+    assert BoundedCache().max_size == BoundedCache.default_max_size == 1024
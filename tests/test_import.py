@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+
+def run_in_subprocess(code):
+    return subprocess.check_output([sys.executable, "-c", code]).decode("utf-8").strip()
+
+
+def test_import_does_not_load_slow_modules():
+    # These should only be imported once they are needed
+    for module_name in ["ROOT", "uproot", "scipy", "matplotlib.pyplot"]:
+        assert run_in_subprocess("import sys, mATLASplotlib; print('{0}' in sys.modules)".format(module_name)) == "False"
+
+
+def test_canvas_does_not_load_pyplot():
+    code = "import os, sys, tempfile, mATLASplotlib\n" \
+           "with mATLASplotlib.canvases.Simple() as canvas:\n" \
+           "    canvas.plot_dataset([0, 1], [5, 10], style='scatter')\n" \
+           "    canvas.save(os.path.join(tempfile.mkdtemp(), 'output'), ['pdf', 'png'])\n" \
+           "print('matplotlib.pyplot' in sys.modules)"
+    assert run_in_subprocess(code).splitlines()[-1] == "False"
+
+
+def test_import_does_not_set_backend():
+    code = "import matplotlib; backend = matplotlib.rcParams['backend']; import mATLASplotlib; print(matplotlib.rcParams['backend'] == backend)"
+    assert run_in_subprocess(code) == "True"
+
+
+def test_save_only_loads_needed_backends():
+    # Each output format should only load the backend that writes it
+    for extension, loaded, not_loaded in [("png", "backend_agg", "backend_pdf"), ("pdf", "backend_pdf", "backend_svg"), ("svg", "backend_svg", "backend_pdf")]:
+        code = "import os, sys, tempfile, mATLASplotlib\n" \
+               "with mATLASplotlib.canvases.Simple() as canvas:\n" \
+               "    canvas.plot_dataset([0, 1], [5, 10], style='scatter')\n" \
+               "    canvas.add_ATLAS_label(0.1, 0.9, plot_type='Internal')\n" \
+               "    canvas.save(os.path.join(tempfile.mkdtemp(), 'output'), '{0}')\n" \
+               "print([name in sys.modules for name in ['matplotlib.backends.{1}', 'matplotlib.backends.{2}']])".format(extension, loaded, not_loaded)
+        assert run_in_subprocess(code).splitlines()[-1] == "[True, False]"